@@ -2,7 +2,7 @@
 
 from .export import Exporter, ExportFormat
 from .monitor import PerformanceMonitor, HealthChecker
-from .watcher import FileWatcher, WatchEvent
+from .watcher import FileWatcher, WatchEvent, WatchEventType
 
 __all__ = [
     'Exporter',
@@ -10,5 +10,6 @@ __all__ = [
     'PerformanceMonitor', 
     'HealthChecker',
     'FileWatcher',
-    'WatchEvent'
+    'WatchEvent',
+    'WatchEventType'
 ]
\ No newline at end of file
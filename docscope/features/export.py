@@ -1,20 +1,69 @@
 """Export functionality for DocScope"""
 
+import csv
+import html
+import io
 import json
 import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from enum import Enum
-from datetime import datetime
+from datetime import date, datetime
 import logging
 import markdown
-from jinja2 import Template, Environment, FileSystemLoader
+from jinja2 import (
+    Template, Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+)
 
 from ..core.models import Document, SearchResult
-from ..storage import StorageManager
+from ..storage import DocumentStore
+
+# orjson is optional; it serializes and indents in native code
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# CSV export columns
+_CSV_FIELDNAMES = ['id', 'title', 'path', 'format', 'size', 'created_at', 'updated_at']
+
+# Documents at or below this count skip Jinja when they carry no
+# metadata or content
+_FAST_PATH_THRESHOLD = 1
+
+# Shared by the export template and the non-Jinja fast path
+_EXPORT_HTML_STYLE = """
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .document { border: 1px solid #ddd; padding: 15px; margin: 10px 0; }
+        .metadata { background: #f5f5f5; padding: 10px; margin: 10px 0; }
+        pre { background: #f0f0f0; padding: 10px; overflow-x: auto; }
+        h2 { color: #333; }
+        .path { color: #666; font-family: monospace; }
+    """
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+class _ExportEncoder(json.JSONEncoder):
+    """Stdlib JSON encoder used when orjson is unavailable"""
+    
+    def default(self, obj: Any) -> Any:
+        return _json_default(obj)
+
+
+_JSON_ENCODER = _ExportEncoder(indent=2)
+
 
 class ExportFormat(Enum):
     """Supported export formats"""
@@ -29,67 +78,74 @@ class ExportFormat(Enum):
 class Exporter:
     """Export documents in various formats"""
     
-    def __init__(self, storage_manager: StorageManager = None):
-        """Initialize exporter"""
+    def __init__(self, storage_manager: DocumentStore = None, cache_dir: Optional[Path] = None):
+        """Initialize exporter
+        
+        When cache_dir is given, compiled templates are persisted there so
+        new processes skip compilation; otherwise nothing is written to disk.
+        """
         self.storage = storage_manager
         self.templates_dir = Path(__file__).parent / "templates"
-        self.env = Environment(loader=FileSystemLoader(self.templates_dir))
+        self.env = Environment(
+            loader=FileSystemLoader(self.templates_dir),
+            autoescape=select_autoescape(['html', 'xml', 'html.j2']),
+            auto_reload=False,
+            bytecode_cache=self._create_bytecode_cache(cache_dir)
+        )
+        self._html_template: Optional[Template] = None
+        self._search_html_template: Optional[Template] = None
+        
+    def _create_bytecode_cache(self, cache_dir: Optional[Path]) -> Optional[FileSystemBytecodeCache]:
+        """Create the on-disk cache for compiled templates, if one was requested"""
+        if cache_dir is None:
+            return None
+        cache_dir = Path(cache_dir).expanduser()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Template bytecode cache disabled: {e}")
+            return None
+        return FileSystemBytecodeCache(str(cache_dir))
         
     def export_document(
         self, 
         document: Union[Document, Dict[str, Any]], 
         format: ExportFormat,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        content_limit: Optional[int] = None
     ) -> Union[str, bytes]:
-        """Export a single document"""
+        """Export a single document
+        
+        content_limit truncates each document's content to that many
+        characters before serialization; None exports the full content.
+        """
         if isinstance(document, Document):
-            doc_dict = self._document_to_dict(document)
+            doc_dict = self._document_to_dict(document, content_limit)
         else:
-            doc_dict = document
+            doc_dict = self._limit_content(document, content_limit)
             
-        if format == ExportFormat.JSON:
-            return self._export_json([doc_dict], output_path)
-        elif format == ExportFormat.YAML:
-            return self._export_yaml([doc_dict], output_path)
-        elif format == ExportFormat.MARKDOWN:
-            return self._export_markdown([doc_dict], output_path)
-        elif format == ExportFormat.HTML:
-            return self._export_html([doc_dict], output_path)
-        elif format == ExportFormat.PDF:
-            return self._export_pdf([doc_dict], output_path)
-        elif format == ExportFormat.CSV:
-            return self._export_csv([doc_dict], output_path)
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+        return self._dispatch([doc_dict], format, output_path)
             
     def export_documents(
         self,
         documents: List[Union[Document, Dict[str, Any]]],
         format: ExportFormat,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        content_limit: Optional[int] = None
     ) -> Union[str, bytes]:
-        """Export multiple documents"""
+        """Export multiple documents
+        
+        content_limit truncates each document's content to that many
+        characters before serialization; None exports the full content.
+        """
         doc_dicts = []
         for doc in documents:
             if isinstance(doc, Document):
-                doc_dicts.append(self._document_to_dict(doc))
+                doc_dicts.append(self._document_to_dict(doc, content_limit))
             else:
-                doc_dicts.append(doc)
+                doc_dicts.append(self._limit_content(doc, content_limit))
                 
-        if format == ExportFormat.JSON:
-            return self._export_json(doc_dicts, output_path)
-        elif format == ExportFormat.YAML:
-            return self._export_yaml(doc_dicts, output_path)
-        elif format == ExportFormat.MARKDOWN:
-            return self._export_markdown(doc_dicts, output_path)
-        elif format == ExportFormat.HTML:
-            return self._export_html(doc_dicts, output_path)
-        elif format == ExportFormat.PDF:
-            return self._export_pdf(doc_dicts, output_path)
-        elif format == ExportFormat.CSV:
-            return self._export_csv(doc_dicts, output_path)
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+        return self._dispatch(doc_dicts, format, output_path)
             
     def export_search_results(
         self,
@@ -124,36 +180,71 @@ class Exporter:
             'suggestions': results.suggestions
         }
         
-        if format == ExportFormat.JSON:
-            return self._export_json(export_data, output_path)
-        elif format == ExportFormat.YAML:
-            return self._export_yaml(export_data, output_path)
-        elif format == ExportFormat.MARKDOWN:
-            return self._export_search_markdown(export_data, output_path)
-        elif format == ExportFormat.HTML:
-            return self._export_search_html(export_data, output_path)
-        else:
-            return self.export_documents(documents, format, output_path)
+        export_func = self._SEARCH_DISPATCH.get(format)
+        if export_func is not None:
+            return export_func(self, export_data, output_path)
+        return self.export_documents(documents, format, output_path)
+        
+    def _dispatch(self, doc_dicts: List[Dict], format: ExportFormat, output_path: Optional[Path]) -> Union[str, bytes]:
+        """Route document dictionaries to the exporter for a format"""
+        try:
+            export_func = self._DISPATCH[format]
+        except KeyError:
+            raise ValueError(f"Unsupported export format: {format}")
+        return export_func(self, doc_dicts, output_path)
             
-    def _document_to_dict(self, document: Document) -> Dict[str, Any]:
+    def _document_to_dict(self, document: Document, content_limit: Optional[int] = None) -> Dict[str, Any]:
         """Convert document model to dictionary"""
+        content = document.content
+        if content_limit is not None and content:
+            content = content[:content_limit]
+            
+        # Freshly scanned documents usually carry identical timestamps, so
+        # reuse the ISO string instead of formatting the same value again
+        created_at = document.created_at.isoformat() if document.created_at else None
+        if document.updated_at == document.created_at:
+            updated_at = created_at
+        else:
+            updated_at = document.updated_at.isoformat() if document.updated_at else None
+        if document.scanned_at == document.updated_at:
+            scanned_at = updated_at
+        else:
+            scanned_at = document.scanned_at.isoformat() if document.scanned_at else None
+            
         return {
             'id': document.id,
             'title': document.title,
-            'content': document.content,
+            'content': content,
             'path': document.path,
             'format': document.format,
             'size': document.size,
             'hash': document.hash,
             'metadata': document.metadata,
-            'created_at': document.created_at.isoformat() if document.created_at else None,
-            'updated_at': document.updated_at.isoformat() if document.updated_at else None,
-            'scanned_at': document.scanned_at.isoformat() if document.scanned_at else None
+            'created_at': created_at,
+            'updated_at': updated_at,
+            'scanned_at': scanned_at
         }
         
+    def _limit_content(self, doc_dict: Dict[str, Any], content_limit: Optional[int]) -> Dict[str, Any]:
+        """Return doc_dict with its content truncated to content_limit characters"""
+        content = doc_dict.get('content')
+        if content_limit is None or not content or len(content) <= content_limit:
+            return doc_dict
+            
+        limited = dict(doc_dict)
+        limited['content'] = content[:content_limit]
+        return limited
+        
     def _export_json(self, data: Any, output_path: Optional[Path]) -> str:
         """Export as JSON"""
-        json_str = json.dumps(data, indent=2, default=str)
+        if orjson is not None:
+            json_str = orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        else:
+            json_str = _JSON_ENCODER.encode(data)
         
         if output_path:
             output_path.write_text(json_str)
@@ -173,29 +264,31 @@ class Exporter:
         
     def _export_markdown(self, documents: List[Dict], output_path: Optional[Path]) -> str:
         """Export as Markdown"""
-        md_lines = ["# Exported Documents\n"]
-        md_lines.append(f"*Exported on {datetime.now().isoformat()}*\n")
+        buf = io.StringIO()
+        write = buf.write
+        write("# Exported Documents\n\n")
+        write(f"*Exported on {datetime.now().isoformat()}*\n\n")
         
         for doc in documents:
-            md_lines.append(f"\n## {doc.get('title', 'Untitled')}\n")
-            md_lines.append(f"- **Path**: `{doc.get('path', 'N/A')}`")
-            md_lines.append(f"- **Format**: {doc.get('format', 'N/A')}")
-            md_lines.append(f"- **Size**: {doc.get('size', 0)} bytes")
+            write(f"\n## {doc.get('title', 'Untitled')}\n\n")
+            write(f"- **Path**: `{doc.get('path', 'N/A')}`\n")
+            write(f"- **Format**: {doc.get('format', 'N/A')}\n")
+            write(f"- **Size**: {doc.get('size', 0)} bytes\n")
             
             if doc.get('metadata'):
-                md_lines.append("\n### Metadata")
+                write("\n### Metadata\n")
                 for key, value in doc['metadata'].items():
-                    md_lines.append(f"- **{key}**: {value}")
+                    write(f"- **{key}**: {value}\n")
                     
             if doc.get('content'):
-                md_lines.append("\n### Content")
-                md_lines.append("```")
-                md_lines.append(doc['content'][:1000])  # First 1000 chars
+                write("\n### Content\n```\n")
+                write(doc['content'][:1000])  # First 1000 chars
+                write("\n")
                 if len(doc['content']) > 1000:
-                    md_lines.append("... (truncated)")
-                md_lines.append("```")
+                    write("... (truncated)\n")
+                write("```\n")
                 
-        md_str = "\n".join(md_lines)
+        md_str = buf.getvalue()
         
         if output_path:
             output_path.write_text(md_str)
@@ -205,53 +298,20 @@ class Exporter:
         
     def _export_html(self, documents: List[Dict], output_path: Optional[Path]) -> str:
         """Export as HTML"""
-        # Create HTML template if not exists
-        html_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>DocScope Export</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .document { border: 1px solid #ddd; padding: 15px; margin: 10px 0; }
-        .metadata { background: #f5f5f5; padding: 10px; margin: 10px 0; }
-        pre { background: #f0f0f0; padding: 10px; overflow-x: auto; }
-        h2 { color: #333; }
-        .path { color: #666; font-family: monospace; }
-    </style>
-</head>
-<body>
-    <h1>DocScope Export</h1>
-    <p><em>Exported on {{ export_date }}</em></p>
-    {% for doc in documents %}
-    <div class="document">
-        <h2>{{ doc.title or 'Untitled' }}</h2>
-        <div class="path">{{ doc.path }}</div>
-        {% if doc.metadata %}
-        <div class="metadata">
-            <h3>Metadata</h3>
-            <ul>
-            {% for key, value in doc.metadata.items() %}
-                <li><strong>{{ key }}:</strong> {{ value }}</li>
-            {% endfor %}
-            </ul>
-        </div>
-        {% endif %}
-        {% if doc.content %}
-        <h3>Content Preview</h3>
-        <pre>{{ doc.content[:1000] }}{% if doc.content|length > 1000 %}... (truncated){% endif %}</pre>
-        {% endif %}
-    </div>
-    {% endfor %}
-</body>
-</html>
-        """
+        export_date = datetime.now().isoformat()
         
-        template = Template(html_template)
-        html_str = template.render(
-            documents=documents,
-            export_date=datetime.now().isoformat()
-        )
+        if len(documents) <= _FAST_PATH_THRESHOLD and not any(
+            doc.get('metadata') or doc.get('content') for doc in documents
+        ):
+            html_str = self._fast_html(documents, export_date)
+        else:
+            if self._html_template is None:
+                self._html_template = self.env.get_template("export.html.j2")
+            html_str = self._html_template.render(
+                documents=documents,
+                export_date=export_date,
+                style=_EXPORT_HTML_STYLE
+            )
         
         if output_path:
             output_path.write_text(html_str)
@@ -259,6 +319,24 @@ class Exporter:
             
         return html_str
         
+    def _fast_html(self, documents: List[Dict], export_date: str) -> str:
+        """Render title/path-only documents without going through Jinja"""
+        parts = [
+            "<!DOCTYPE html>\n<html>\n<head>\n    <title>DocScope Export</title>\n",
+            f"    <style>{_EXPORT_HTML_STYLE}</style>\n</head>\n<body>\n",
+            "    <h1>DocScope Export</h1>\n",
+            f"    <p><em>Exported on {html.escape(export_date)}</em></p>\n",
+        ]
+        for doc in documents:
+            parts.append(
+                '    <div class="document">\n'
+                f"        <h2>{html.escape(str(doc.get('title') or 'Untitled'))}</h2>\n"
+                f"        <div class=\"path\">{html.escape(str(doc.get('path', '')))}</div>\n"
+                "    </div>\n"
+            )
+        parts.append("</body>\n</html>\n")
+        return "".join(parts)
+        
     def _export_pdf(self, documents: List[Dict], output_path: Optional[Path]) -> bytes:
         """Export as PDF"""
         # First convert to HTML
@@ -280,20 +358,10 @@ class Exporter:
             
     def _export_csv(self, documents: List[Dict], output_path: Optional[Path]) -> str:
         """Export as CSV"""
-        import csv
-        import io
-        
         output = io.StringIO()
-        
-        # Define CSV columns
-        fieldnames = ['id', 'title', 'path', 'format', 'size', 'created_at', 'updated_at']
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for doc in documents:
-            row = {k: doc.get(k, '') for k in fieldnames}
-            writer.writerow(row)
+        writer = csv.writer(output)
+        writer.writerow(_CSV_FIELDNAMES)
+        writer.writerows([doc.get(k, '') for k in _CSV_FIELDNAMES] for doc in documents)
             
         csv_str = output.getvalue()
         
@@ -305,28 +373,30 @@ class Exporter:
         
     def _export_search_markdown(self, data: Dict, output_path: Optional[Path]) -> str:
         """Export search results as Markdown"""
-        md_lines = ["# Search Results\n"]
-        md_lines.append(f"**Query**: `{data['query']}`")
-        md_lines.append(f"**Total Results**: {data['total']}")
-        md_lines.append(f"**Search Time**: {data['search_time']:.3f}s\n")
+        buf = io.StringIO()
+        write = buf.write
+        write("# Search Results\n\n")
+        write(f"**Query**: `{data['query']}`\n")
+        write(f"**Total Results**: {data['total']}\n")
+        write(f"**Search Time**: {data['search_time']:.3f}s\n\n")
         
         if data.get('facets'):
-            md_lines.append("## Facets\n")
+            write("## Facets\n\n")
             for facet_name, facet_values in data['facets'].items():
-                md_lines.append(f"### {facet_name}")
+                write(f"### {facet_name}\n")
                 for value, count in facet_values.items():
-                    md_lines.append(f"- {value}: {count}")
-                md_lines.append("")
+                    write(f"- {value}: {count}\n")
+                write("\n")
                 
-        md_lines.append("## Results\n")
+        write("## Results\n\n")
         for doc in data['documents']:
-            md_lines.append(f"### {doc.get('title', 'Untitled')} (Score: {doc.get('score', 0):.2f})")
-            md_lines.append(f"- **Path**: `{doc.get('path', 'N/A')}`")
+            write(f"### {doc.get('title', 'Untitled')} (Score: {doc.get('score', 0):.2f})\n")
+            write(f"- **Path**: `{doc.get('path', 'N/A')}`\n")
             
             if doc.get('snippet'):
-                md_lines.append(f"\n{doc['snippet']}\n")
+                write(f"\n{doc['snippet']}\n\n")
                 
-        md_str = "\n".join(md_lines)
+        md_str = buf.getvalue()
         
         if output_path:
             output_path.write_text(md_str)
@@ -336,62 +406,29 @@ class Exporter:
         
     def _export_search_html(self, data: Dict, output_path: Optional[Path]) -> str:
         """Export search results as HTML"""
-        html_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Search Results - {{ query }}</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .stats { background: #f0f0f0; padding: 10px; margin: 20px 0; }
-        .result { border-left: 3px solid #007bff; padding: 10px; margin: 15px 0; }
-        .score { color: #666; font-size: 0.9em; }
-        .snippet { margin: 10px 0; color: #333; }
-        .highlight { background: yellow; }
-        .facets { background: #f8f9fa; padding: 15px; margin: 20px 0; }
-    </style>
-</head>
-<body>
-    <h1>Search Results</h1>
-    <div class="stats">
-        <strong>Query:</strong> {{ query }}<br>
-        <strong>Total Results:</strong> {{ total }}<br>
-        <strong>Search Time:</strong> {{ "%.3f"|format(search_time) }}s
-    </div>
-    
-    {% if facets %}
-    <div class="facets">
-        <h2>Filters</h2>
-        {% for facet_name, facet_values in facets.items() %}
-        <h3>{{ facet_name }}</h3>
-        <ul>
-        {% for value, count in facet_values.items() %}
-            <li>{{ value }} ({{ count }})</li>
-        {% endfor %}
-        </ul>
-        {% endfor %}
-    </div>
-    {% endif %}
-    
-    <h2>Results</h2>
-    {% for doc in documents %}
-    <div class="result">
-        <h3>{{ doc.title or 'Untitled' }} <span class="score">Score: {{ "%.2f"|format(doc.score) }}</span></h3>
-        <div class="path">{{ doc.path }}</div>
-        {% if doc.snippet %}
-        <div class="snippet">{{ doc.snippet }}</div>
-        {% endif %}
-    </div>
-    {% endfor %}
-</body>
-</html>
-        """
-        
-        template = Template(html_template)
-        html_str = template.render(**data)
+        if self._search_html_template is None:
+            self._search_html_template = self.env.get_template("search.html.j2")
+        html_str = self._search_html_template.render(**data)
         
         if output_path:
             output_path.write_text(html_str)
             logger.info(f"Exported search results to HTML: {output_path}")
             
-        return html_str
\ No newline at end of file
+        return html_str
+        
+    # Format dispatch tables, keyed by export format
+    _DISPATCH = {
+        ExportFormat.JSON: _export_json,
+        ExportFormat.YAML: _export_yaml,
+        ExportFormat.MARKDOWN: _export_markdown,
+        ExportFormat.HTML: _export_html,
+        ExportFormat.PDF: _export_pdf,
+        ExportFormat.CSV: _export_csv,
+    }
+    
+    _SEARCH_DISPATCH = {
+        ExportFormat.JSON: _export_json,
+        ExportFormat.YAML: _export_yaml,
+        ExportFormat.MARKDOWN: _export_search_markdown,
+        ExportFormat.HTML: _export_search_html,
+    }
@@ -0,0 +1,469 @@
+"""Linux inotify observer for the DocScope file watcher
+
+A drop-in replacement for watchdog's Observer that drives every watch from
+a single inotify descriptor. One thread waits on an edge-triggered epoll
+set holding the inotify fd and an eventfd used to wake it on stop(); each
+wakeup reads the descriptor until it would block and dispatches the
+parsed events to the scheduled handlers.
+
+With a file filter the observer watches matching files individually:
+directories only report namespace changes (create, delete, move) and
+content changes come from per-file watches, so writes to unrelated files
+never reach Python. Each file costs one inotify watch, counted against
+fs.inotify.max_user_watches.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from collections import namedtuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (
+    IN_CREATE | IN_MODIFY | IN_DELETE |
+    IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF
+)
+
+# Masks used when files are watched individually
+DIRECTORY_MASK = WATCH_MASK & ~IN_MODIFY
+FILE_MASK = IN_MODIFY
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Event passed to the scheduled handlers; mirrors the attributes of
+# watchdog's FileSystemEvent that DocScopeEventHandler reads
+InotifyEvent = namedtuple("InotifyEvent", ["src_path", "dest_path", "is_directory"])
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc when it exposes the inotify calls"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+def _walk(root: str, recursive: bool = True) -> Iterator[Tuple[str, List[str]]]:
+    """Yield (directory, file paths) for root and, if recursive, below it
+    
+    Uses os.scandir so entry types come from readdir and no entry is
+    stat'ed; symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            continue
+        yield directory, files
+
+INOTIFY_AVAILABLE = _libc is not None and hasattr(select, "epoll")
+
+# os.eventfd needs Python 3.10; older versions wake the loop through a pipe
+_HAVE_EVENTFD = hasattr(os, "eventfd")
+
+
+def _open_wake_fds() -> Tuple[int, int]:
+    """Open the (read, write) descriptors used to wake the event loop"""
+    if _HAVE_EVENTFD:
+        fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        return fd, fd
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    return read_fd, write_fd
+
+
+class InotifyWatch:
+    """A path scheduled on an InotifyObserver"""
+
+    def __init__(self, handler, path: str, recursive: bool):
+        self.handler = handler
+        self.path = path
+        self.is_recursive = recursive
+        self.wds: Set[int] = set()
+
+    def covers(self, directory: str) -> bool:
+        """Check whether a watched directory belongs to this watch"""
+        if directory == self.path:
+            return True
+        return self.is_recursive and directory.startswith(self.path + os.sep)
+
+    def __repr__(self) -> str:
+        return f"InotifyWatch(path={self.path!r}, recursive={self.is_recursive})"
+
+
+class InotifyObserver:
+    """Observer backed by one inotify descriptor and an epoll loop"""
+
+    def __init__(self, file_filter: Optional[Callable[[str], bool]] = None):
+        """Initialize the observer
+        
+        Args:
+            file_filter: When given, only files accepted by this predicate
+                are watched for content changes, each with its own watch
+        """
+        if not INOTIFY_AVAILABLE:
+            raise OSError("inotify is not available on this platform")
+
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        try:
+            self._wake_fd, self._wake_write_fd = _open_wake_fds()
+        except OSError:
+            os.close(self._fd)
+            raise
+        self._closed = False
+        self._lock = threading.RLock()
+        self._watches: List[InotifyWatch] = []
+        self._wd_paths: Dict[int, str] = {}
+        self._path_wds: Dict[str, int] = {}
+        self._file_wds: Set[int] = set()
+        self._file_filter = file_filter
+        self._directory_mask = DIRECTORY_MASK if file_filter else WATCH_MASK
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def schedule(self, handler, path: str, recursive: bool = False) -> InotifyWatch:
+        """Start delivering events under path to handler"""
+        watch = InotifyWatch(handler, os.path.abspath(path), recursive)
+        with self._lock:
+            self._watches.append(watch)
+            # Directories that were already watched may now have a new owner
+            watch.wds.update(
+                wd for path, wd in self._path_wds.items()
+                if watch.covers(self._owner_directory(path, wd))
+            )
+            self._add_tree(watch.path, recursive)
+        return watch
+
+    def unschedule(self, watch: InotifyWatch):
+        """Stop delivering events for a single watch"""
+        with self._lock:
+            if watch in self._watches:
+                self._watches.remove(watch)
+                self._refresh_owners()
+
+    def unschedule_all(self):
+        """Stop delivering events for every watch"""
+        with self._lock:
+            self._watches.clear()
+            self._refresh_owners()
+
+    def start(self):
+        """Start the event loop thread"""
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name="docscope-inotify",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Wake the event loop and ask it to exit"""
+        self._running = False
+        if not self._closed:
+            try:
+                os.write(self._wake_write_fd, (1).to_bytes(8, sys.byteorder))
+            except BlockingIOError:
+                # A wakeup is already pending
+                pass
+
+    def close(self):
+        """Release the inotify and wake descriptors
+        
+        An observer that was started closes them when its event loop
+        exits; this covers observers that never ran and stops a loop that
+        is still running.
+        """
+        if self.is_alive():
+            self.stop()
+            return
+        with self._lock:
+            if not self._closed:
+                self._close_fds()
+
+    def _close_fds(self):
+        self._closed = True
+        os.close(self._fd)
+        os.close(self._wake_fd)
+        if self._wake_write_fd != self._wake_fd:
+            os.close(self._wake_write_fd)
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the event loop to exit"""
+        if self._thread:
+            self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _add_tree(self, root: str, recursive: bool):
+        """Add watches for root and, if recursive, every directory below it"""
+        if not recursive and not self._file_filter:
+            self._add_owned_watch(root, self._directory_mask)
+            return
+        for directory, files in _walk(root, recursive):
+            if self._add_owned_watch(directory, self._directory_mask) is None:
+                continue
+            if self._file_filter:
+                for path in files:
+                    self._add_file_watch(path)
+
+    def _add_file_watch(self, path: str, replace: bool = False):
+        """Watch a single file for content changes if the filter accepts it
+        
+        With replace, a watch already held for path is swapped for a new
+        one: the path now names a different inode, as after an editor
+        renames a temporary file over it, and the old watch would only
+        report changes to the replaced file.
+        """
+        if not self._file_filter(path):
+            return
+        stale = self._path_wds.get(path)
+        if stale is not None:
+            if not replace:
+                return
+            self._drop_wd(stale)
+            _libc.inotify_rm_watch(self._fd, stale)
+        wd = self._add_owned_watch(path, FILE_MASK)
+        if wd is not None:
+            self._file_wds.add(wd)
+
+    def _add_owned_watch(self, path: str, mask: int) -> Optional[int]:
+        """Add a watch and attach it to every scheduled watch covering it"""
+        wd = self._add_watch(path, mask)
+        if wd is not None:
+            directory = path if mask != FILE_MASK else os.path.dirname(path)
+            for watch in self._watches:
+                if watch.covers(directory):
+                    watch.wds.add(wd)
+        return wd
+
+    def _owner_directory(self, path: str, wd: int) -> str:
+        """Directory whose watches own a watched path"""
+        return os.path.dirname(path) if wd in self._file_wds else path
+
+    def _add_watch(self, path: str, mask: int) -> Optional[int]:
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err not in (errno.ENOENT, errno.ENOTDIR):
+                logger.warning("Failed to watch %s: %s", path, os.strerror(err))
+            return None
+        self._wd_paths[wd] = path
+        self._path_wds[path] = wd
+        return wd
+
+    def _drop_wd(self, wd: int):
+        path = self._wd_paths.pop(wd, None)
+        if path is not None:
+            self._path_wds.pop(path, None)
+        self._file_wds.discard(wd)
+
+    def _forget_tree(self, root: str):
+        """Drop the watches for root and every directory below it"""
+        prefix = root + os.sep
+        for path in [p for p in self._path_wds if p == root or p.startswith(prefix)]:
+            wd = self._path_wds[path]
+            self._drop_wd(wd)
+            _libc.inotify_rm_watch(self._fd, wd)
+
+    def _rename_tree(self, old_root: str, new_root: str):
+        """Rewrite the paths of watched directories and files after a move"""
+        prefix = old_root + os.sep
+        for path in [p for p in self._path_wds if p == old_root or p.startswith(prefix)]:
+            wd = self._path_wds.pop(path)
+            renamed = new_root + path[len(old_root):]
+            self._wd_paths[wd] = renamed
+            self._path_wds[renamed] = wd
+
+    def _refresh_owners(self):
+        """Recompute which watches own each directory and drop unowned ones"""
+        for watch in self._watches:
+            watch.wds.clear()
+        for path, wd in list(self._path_wds.items()):
+            directory = self._owner_directory(path, wd)
+            owners = [watch for watch in self._watches if watch.covers(directory)]
+            if owners:
+                for watch in owners:
+                    watch.wds.add(wd)
+            else:
+                self._drop_wd(wd)
+                _libc.inotify_rm_watch(self._fd, wd)
+
+    def _run(self):
+        epoll = select.epoll()
+        try:
+            epoll.register(self._fd, select.EPOLLIN | select.EPOLLET)
+            epoll.register(self._wake_fd, select.EPOLLIN | select.EPOLLET)
+            while self._running:
+                for fd, _ in epoll.poll():
+                    if fd == self._fd:
+                        self._read_events()
+        except Exception as e:
+            logger.error("inotify loop failed: %s", e)
+        finally:
+            epoll.close()
+            with self._lock:
+                if not self._closed:
+                    self._close_fds()
+
+    def _read_events(self):
+        """Read the inotify descriptor until it would block"""
+        while True:
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            except InterruptedError:
+                continue
+            self._dispatch(buffer)
+
+    def _dispatch(self, buffer: bytes):
+        """Parse a read buffer and deliver its events"""
+        moved_from: Dict[int, tuple] = {}
+        header_size = _EVENT_HEADER.size
+        offset = 0
+
+        with self._lock:
+            while offset < len(buffer):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += header_size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    logger.warning("inotify queue overflowed; some events were lost")
+                    continue
+                if mask & IN_IGNORED:
+                    self._drop_wd(wd)
+                    continue
+
+                directory = self._wd_paths.get(wd)
+                if directory is None or mask & IN_DELETE_SELF:
+                    continue
+                if wd in self._file_wds:
+                    # Per-file watches only report content changes
+                    if mask & IN_MODIFY:
+                        self._emit(wd, "on_modified", InotifyEvent(directory, None, False))
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                is_dir = bool(mask & IN_ISDIR)
+
+                if mask & IN_MOVED_FROM:
+                    moved_from[cookie] = (path, is_dir)
+                elif mask & IN_MOVED_TO:
+                    source = moved_from.pop(cookie, None)
+                    if source is None:
+                        self._created(wd, path, is_dir)
+                    else:
+                        self._moved(wd, source[0], path, is_dir)
+                elif mask & IN_CREATE:
+                    self._created(wd, path, is_dir)
+                elif mask & IN_DELETE:
+                    if not is_dir:
+                        self._emit(wd, "on_deleted", InotifyEvent(path, None, False))
+                elif mask & IN_MODIFY:
+                    if not is_dir:
+                        self._emit(wd, "on_modified", InotifyEvent(path, None, False))
+
+            # Sources whose destination is outside every watch were removed
+            for path, is_dir in moved_from.values():
+                self._forget_tree(path)
+                if not is_dir:
+                    self._emit_for_path(path, "on_deleted", InotifyEvent(path, None, False))
+
+    def _created(self, wd: int, path: str, is_dir: bool):
+        if not is_dir:
+            if self._file_filter:
+                self._add_file_watch(path, replace=True)
+            self._emit(wd, "on_created", InotifyEvent(path, None, False))
+            return
+        if not any(watch.is_recursive for watch in self._owners(wd)):
+            return
+        # Files can land in a new directory before its watch is added
+        self._add_tree(path, True)
+        for file_path in self._walk_files(path):
+            self._emit_for_path(file_path, "on_created", InotifyEvent(file_path, None, False))
+
+    def _moved(self, wd: int, src_path: str, dest_path: str, is_dir: bool):
+        if not is_dir:
+            if self._file_filter:
+                self._forget_tree(src_path)
+                self._add_file_watch(dest_path, replace=True)
+            self._emit(wd, "on_moved", InotifyEvent(src_path, dest_path, False))
+            return
+        self._rename_tree(src_path, dest_path)
+        self._refresh_owners()
+        for file_path in self._walk_files(dest_path):
+            old_path = src_path + file_path[len(dest_path):]
+            self._emit_for_path(file_path, "on_moved", InotifyEvent(old_path, file_path, False))
+
+    def _owners(self, wd: int) -> List[InotifyWatch]:
+        return [watch for watch in self._watches if wd in watch.wds]
+
+    def _emit(self, wd: int, method: str, event: InotifyEvent):
+        for watch in self._owners(wd):
+            self._call(watch, method, event)
+
+    def _emit_for_path(self, path: str, method: str, event: InotifyEvent):
+        directory = os.path.dirname(path)
+        for watch in self._watches:
+            if watch.covers(directory):
+                self._call(watch, method, event)
+
+    def _call(self, watch: InotifyWatch, method: str, event: InotifyEvent):
+        try:
+            getattr(watch.handler, method)(event)
+        except Exception as e:
+            logger.error("Handler error for %s: %s", event.src_path, e)
+
+    @staticmethod
+    def _walk_files(root: str) -> List[str]:
+        return [path for _, files in _walk(root) for path in files]
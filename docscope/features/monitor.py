@@ -3,12 +3,20 @@
 import time
 import psutil
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import deque
+from collections import Counter, deque
 import logging
 
+# NumPy is optional (installed with the "ai" extra)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,14 +43,26 @@ class HealthStatus:
 class PerformanceMonitor:
     """Monitor application performance metrics"""
     
-    def __init__(self, max_history: int = 1000):
+    # Number of recent samples summarized by get_application_metrics
+    RECENT_WINDOW = 100
+    
+    def __init__(self, max_history: int = 1000, system_metrics_ttl: float = 1.0):
         """Initialize performance monitor"""
         self.metrics: Dict[str, deque] = {}
         self.max_history = max_history
+        # Raw values of the most recent samples, used for summary statistics
+        self._recent_values: Dict[str, deque] = {}
         self.start_time = time.time()
-        self.counters: Dict[str, int] = {}
+        self._start_perf = time.perf_counter()
+        self.counters: Counter = Counter()
         self.lock = threading.Lock()
         
+        # System metrics are cached briefly since pollers usually sample
+        # faster than the underlying values change
+        self._sys_ttl = system_metrics_ttl
+        self._last_sys_metrics: Optional[Dict[str, Any]] = None
+        self._last_sys_ts = 0.0
+        
         # Start system metrics collection
         self._init_system_metrics()
         
@@ -62,39 +82,37 @@ class PerformanceMonitor:
         with self.lock:
             if name not in self.metrics:
                 self.metrics[name] = deque(maxlen=self.max_history)
+                self._recent_values[name] = deque(
+                    maxlen=min(self.RECENT_WINDOW, self.max_history)
+                )
             self.metrics[name].append(metric)
+            self._recent_values[name].append(value)
             
     def increment_counter(self, name: str, value: int = 1):
         """Increment a counter metric"""
         with self.lock:
-            if name not in self.counters:
-                self.counters[name] = 0
             self.counters[name] += value
             
     def get_counter(self, name: str) -> int:
         """Get counter value"""
         return self.counters.get(name, 0)
         
+    @contextmanager
     def measure_time(self, name: str):
         """Context manager to measure execution time"""
-        class TimeMeasure:
-            def __init__(self, monitor, metric_name):
-                self.monitor = monitor
-                self.metric_name = metric_name
-                self.start_time = None
-                
-            def __enter__(self):
-                self.start_time = time.time()
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                elapsed = time.time() - self.start_time
-                self.monitor.record_metric(self.metric_name, elapsed * 1000, "ms")
-                
-        return TimeMeasure(self, name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_metric(name, (time.perf_counter() - start) * 1000, "ms")
         
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get current system metrics"""
+        now = time.monotonic()
+        cached = self._last_sys_metrics
+        if cached is not None and now - self._last_sys_ts < self._sys_ttl:
+            return {**cached, 'uptime': time.perf_counter() - self._start_perf}
+            
         try:
             # CPU metrics
             cpu_percent = self.process.cpu_percent()
@@ -122,7 +140,7 @@ class PerformanceMonitor:
             except (AttributeError, psutil.AccessDenied):
                 connections = 0
                 
-            return {
+            metrics = {
                 'cpu': {
                     'percent': cpu_percent,
                     'count': cpu_count
@@ -136,9 +154,13 @@ class PerformanceMonitor:
                 'disk_io': disk_io,
                 'connections': connections,
                 'threads': self.process.num_threads(),
-                'uptime': time.time() - self.start_time
+                'uptime': time.perf_counter() - self._start_perf
             }
             
+            self._last_sys_metrics = metrics
+            self._last_sys_ts = now
+            return metrics
+            
         except Exception as e:
             logger.error(f"Failed to get system metrics: {e}")
             return {}
@@ -154,18 +176,33 @@ class PerformanceMonitor:
             # Calculate statistics for each metric
             for name, values in self.metrics.items():
                 if values:
-                    recent_values = [m.value for m in list(values)[-100:]]
+                    recent_values = self._recent_values[name]
                     app_metrics['metrics'][name] = {
                         'count': len(values),
                         'latest': values[-1].value,
-                        'min': min(recent_values),
-                        'max': max(recent_values),
-                        'avg': sum(recent_values) / len(recent_values),
+                        **self._summarize(recent_values),
                         'unit': values[-1].unit
                     }
                     
             return app_metrics
             
+    @staticmethod
+    def _summarize(values: deque) -> Dict[str, float]:
+        """Compute min/max/avg over a window of raw metric values"""
+        if np is not None:
+            arr = np.fromiter(values, dtype=np.float64, count=len(values))
+            return {
+                'min': float(arr.min()),
+                'max': float(arr.max()),
+                'avg': float(arr.mean())
+            }
+            
+        return {
+            'min': min(values),
+            'max': max(values),
+            'avg': sum(values) / len(values)
+        }
+        
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get complete metrics summary"""
         return {
@@ -182,29 +219,46 @@ class PerformanceMonitor:
                 
     def clear_metrics(self, name: str = None):
         """Clear metric history"""
+        self._last_sys_metrics = None
         with self.lock:
             if name:
                 if name in self.metrics:
                     self.metrics[name].clear()
+                    self._recent_values[name].clear()
             else:
                 for metric_list in self.metrics.values():
                     metric_list.clear()
+                for recent_values in self._recent_values.values():
+                    recent_values.clear()
 
 
 class HealthChecker:
     """Perform health checks on DocScope components"""
     
-    def __init__(self):
+    def __init__(self, check_timeout: float = 2.0, max_workers: int = 4):
         """Initialize health checker"""
         self.checks: Dict[str, Callable] = {}
+        self.check_timeout = check_timeout
+        self.max_workers = max_workers
         self.check_results: Dict[str, HealthStatus] = {}
         self.lock = threading.Lock()
         
+        # Shared by every run_all_checks call; created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running: Dict[str, Future] = {}
+        # Bumped for each run of a check and when a run times out; a
+        # worker only records its result if its generation is current
+        self._generations: Counter = Counter()
+        
         # Register default checks
         self._register_default_checks()
         
     def _register_default_checks(self):
         """Register default health checks"""
+        # Prime the CPU sampler so the non-blocking reads in _check_system
+        # measure usage since this point rather than returning 0.0
+        psutil.cpu_percent(interval=None)
+        
         self.register_check("system", self._check_system)
         self.register_check("disk_space", self._check_disk_space)
         self.register_check("memory", self._check_memory)
@@ -223,12 +277,15 @@ class HealthChecker:
         if name not in self.checks:
             return None
             
+        with self.lock:
+            self._generations[name] += 1
+            generation = self._generations[name]
+        return self._run_check(name, generation)
+        
+    def _run_check(self, name: str, generation: int) -> HealthStatus:
+        """Run a check and record its result unless a newer run superseded it"""
         try:
             status = self.checks[name]()
-            with self.lock:
-                self.check_results[name] = status
-            return status
-            
         except Exception as e:
             logger.error(f"Health check '{name}' failed: {e}")
             status = HealthStatus(
@@ -236,17 +293,72 @@ class HealthChecker:
                 healthy=False,
                 message=f"Check failed: {str(e)}"
             )
-            with self.lock:
+            
+        with self.lock:
+            if self._generations[name] == generation:
                 self.check_results[name] = status
-            return status
+        return status
             
     def run_all_checks(self) -> Dict[str, HealthStatus]:
-        """Run all registered health checks"""
+        """Run all registered health checks
+        
+        Checks are independent and mostly I/O-bound, so they run concurrently
+        on a bounded pool shared between calls. Checks still pending after
+        check_timeout seconds are reported as unhealthy instead of blocking
+        the caller; a check still running from an earlier call is not
+        started again and is reported as timed out.
+        """
+        names = list(self.checks)
+        if not names:
+            return {}
+            
+        futures = {}
+        with self.lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="health-check"
+                )
+            for name in names:
+                previous = self._running.get(name)
+                if previous is not None and not previous.done():
+                    continue
+                self._generations[name] += 1
+                futures[name] = self._executor.submit(
+                    self._run_check, name, self._generations[name]
+                )
+                self._running[name] = futures[name]
+                
+        wait(futures.values(), timeout=self.check_timeout)
+        
         results = {}
-        for name in self.checks:
-            results[name] = self.run_check(name)
+        for name in names:
+            future = futures.get(name)
+            if future is not None and future.done():
+                results[name] = future.result()
+                continue
+                
+            logger.warning(f"Health check '{name}' timed out after {self.check_timeout}s")
+            status = HealthStatus(
+                name=name,
+                healthy=False,
+                message=f"Check timed out after {self.check_timeout}s"
+            )
+            with self.lock:
+                # Late workers see a newer generation and drop their result
+                self._generations[name] += 1
+                self.check_results[name] = status
+            results[name] = status
         return results
         
+    def close(self):
+        """Shut down the check pool without waiting for running checks"""
+        with self.lock:
+            executor, self._executor = self._executor, None
+            self._running.clear()
+        if executor is not None:
+            executor.shutdown(wait=False)
+        
     def get_status(self) -> Dict[str, Any]:
         """Get overall health status"""
         with self.lock:
@@ -272,8 +384,8 @@ class HealthChecker:
     def _check_system(self) -> HealthStatus:
         """Check basic system health"""
         try:
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Check CPU usage since the previous sample (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             # Check if CPU is overloaded
             if cpu_percent > 90:
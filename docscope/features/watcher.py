@@ -1,22 +1,131 @@
 """File system watcher for DocScope"""
 
 import os
+import re
+import sys
 import time
 import threading
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Callable, Any
+from typing import Deque, Dict, List, Set, Tuple, Optional, Callable, Any, Union
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+import hashlib
 import logging
+import uuid
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
-from ..scanner import Scanner
-from ..storage import StorageManager
-from ..search import SearchIndex
+from .inotify import INOTIFY_AVAILABLE, InotifyObserver
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from ..scanner import DocumentScanner
+from ..storage import DocumentStore
+from ..search import SearchEngine
+from ..core.models import Document, DocumentFormat, DocumentStatus
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of path strings remembered by the ignore-pattern cache
+_IGNORE_CACHE_SIZE = 4096
+
+# WatchEvent drops its per-instance __dict__ where dataclasses support slots
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Executor.shutdown() can drop queued work only from Python 3.9
+_CANCEL_FUTURES = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+# Storage methods required to write a debounced batch in bulk
+_BATCH_STORAGE_METHODS = ('store_documents', 'update_documents', 'delete_documents')
+
+
+# Bytes read at a time when fingerprinting a file
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_PATH_SEPARATORS = re.compile(r'[/\\]')
+
+
+def _split_ignore_patterns(patterns: Set[str]) -> Tuple[frozenset, Set[str]]:
+    """Split ignore patterns into literal component names and the rest
+    
+    Literal names such as '.git' or 'node_modules' can be matched with a
+    set lookup per path component; only patterns with wildcards or path
+    separators need the regex.
+    """
+    literal = frozenset(
+        pattern for pattern in patterns
+        if not any(char in pattern for char in '*?/\\')
+    )
+    return literal, set(patterns) - literal
+
+
+def _compile_ignore_patterns(patterns: Set[str]) -> Optional["re.Pattern[str]"]:
+    """Compile glob ignore patterns into a single regex
+    
+    Each pattern is matched against whole path components, so '.git'
+    matches '.git/config' but not '.github/workflow.yml'. '*' and '?' stay
+    within a component and '**' spans directories.
+    """
+    if not patterns:
+        return None
+        
+    alternatives = []
+    for pattern in sorted(patterns):
+        regex = re.escape(pattern)
+        regex = regex.replace(r'\*\*', '.*')
+        regex = regex.replace(r'\*', r'[^/\\]*').replace(r'\?', r'[^/\\]')
+        alternatives.append(regex)
+        
+    return re.compile(r'(?:^|[/\\])(?:%s)(?=[/\\]|$)' % '|'.join(alternatives))
+
+
+def _fingerprint(path: str) -> Optional[int]:
+    """Hash of a file's whole content, used to skip writes that changed nothing"""
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(partial(f.read, _HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    return int.from_bytes(hasher.digest(), 'little')
+
+
+def _scan_result_to_document(path: str, result: Any) -> Document:
+    """Build the Document stored for a file from its scan result
+    
+    Scanners may return a Document or a dict of its fields; fields the
+    dict leaves out are taken from the file itself.
+    """
+    if isinstance(result, Document):
+        return result
+        
+    stat = os.stat(path)
+    content = result.get('content', '')
+    return Document(
+        id=result.get('id') or str(uuid.uuid4()),
+        path=result.get('path', path),
+        title=result.get('title') or Path(path).stem,
+        content=content,
+        format=DocumentFormat(result.get('format', DocumentFormat.UNKNOWN)),
+        size=result.get('size', stat.st_size),
+        content_hash=result.get('content_hash')
+        or hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        created_at=result.get('created_at') or datetime.fromtimestamp(stat.st_ctime),
+        modified_at=result.get('modified_at') or datetime.fromtimestamp(stat.st_mtime),
+        indexed_at=datetime.now(),
+        tags=list(result.get('tags', [])),
+        metadata=dict(result.get('metadata', {})),
+        status=DocumentStatus.INDEXED
+    )
+
 
 class WatchEventType(Enum):
     """Types of file system events"""
@@ -26,17 +135,36 @@ class WatchEventType(Enum):
     MOVED = "moved"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WatchEvent:
-    """File system watch event"""
+    """File system watch event
+    
+    Paths are kept as the raw strings reported by the observer; use
+    path_obj/old_path_obj where a Path is required. path_str and
+    old_path_str hold the string form of paths given as Path objects.
+    """
     type: WatchEventType
-    path: Path
-    old_path: Optional[Path] = None
+    path: str
+    old_path: Optional[str] = None
     timestamp: float = None
+    path_str: str = field(init=False, repr=False, compare=False)
+    old_path_str: Optional[str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time.time()
+        self.path_str = os.fspath(self.path)
+        self.old_path_str = os.fspath(self.old_path) if self.old_path is not None else None
+            
+    @property
+    def path_obj(self) -> Path:
+        """Event path as a Path"""
+        return Path(self.path)
+        
+    @property
+    def old_path_obj(self) -> Optional[Path]:
+        """Previous path of a moved file as a Path"""
+        return Path(self.old_path) if self.old_path is not None else None
 
 
 class DocScopeEventHandler(FileSystemEventHandler):
@@ -48,7 +176,7 @@ class DocScopeEventHandler(FileSystemEventHandler):
     def on_created(self, event: FileSystemEvent):
         """Handle file creation"""
         if not event.is_directory:
-            path = Path(event.src_path)
+            path = event.src_path
             if self.watcher.should_process(path):
                 watch_event = WatchEvent(
                     type=WatchEventType.CREATED,
@@ -59,7 +187,7 @@ class DocScopeEventHandler(FileSystemEventHandler):
     def on_modified(self, event: FileSystemEvent):
         """Handle file modification"""
         if not event.is_directory:
-            path = Path(event.src_path)
+            path = event.src_path
             if self.watcher.should_process(path):
                 watch_event = WatchEvent(
                     type=WatchEventType.MODIFIED,
@@ -70,24 +198,22 @@ class DocScopeEventHandler(FileSystemEventHandler):
     def on_deleted(self, event: FileSystemEvent):
         """Handle file deletion"""
         if not event.is_directory:
-            path = Path(event.src_path)
             watch_event = WatchEvent(
                 type=WatchEventType.DELETED,
-                path=path
+                path=event.src_path
             )
             self.watcher.handle_event(watch_event)
             
     def on_moved(self, event: FileSystemEvent):
         """Handle file move/rename"""
         if not event.is_directory:
-            old_path = Path(event.src_path)
-            new_path = Path(event.dest_path)
+            new_path = event.dest_path
             
             if self.watcher.should_process(new_path):
                 watch_event = WatchEvent(
                     type=WatchEventType.MOVED,
                     path=new_path,
-                    old_path=old_path
+                    old_path=event.src_path
                 )
                 self.watcher.handle_event(watch_event)
 
@@ -97,36 +223,140 @@ class FileWatcher:
     
     def __init__(
         self,
-        scanner: Scanner = None,
-        storage: StorageManager = None,
-        search_index: SearchIndex = None,
-        debounce_seconds: float = 1.0
+        scanner: DocumentScanner = None,
+        storage: DocumentStore = None,
+        search_index: SearchEngine = None,
+        debounce_seconds: float = 1.0,
+        max_batch_window: Optional[float] = None,
+        use_inotify: bool = True,
+        per_file_mode: bool = False
     ):
-        """Initialize file watcher"""
+        """Initialize file watcher
+        
+        A batch is flushed once no event has arrived for debounce_seconds.
+        If max_batch_window is set, a batch that keeps receiving events is
+        flushed at the latest that many seconds after its first event; it
+        should not be shorter than debounce_seconds.
+        On Linux all watches share one inotify descriptor unless
+        use_inotify is False, in which case watchdog's Observer is used.
+        With per_file_mode, inotify watches each file accepted by
+        should_process instead of reporting every write in the tree.
+        """
         self.scanner = scanner
         self.storage = storage
         self.search_index = search_index
         self.debounce_seconds = debounce_seconds
+        self.max_batch_window = max_batch_window
+        if max_batch_window is not None and max_batch_window < debounce_seconds:
+            logger.warning(
+                "max_batch_window (%ss) is shorter than debounce_seconds (%ss); "
+                "batches will be flushed before the debounce interval ends",
+                max_batch_window, debounce_seconds
+            )
         
-        self.observer = Observer()
+        if use_inotify and INOTIFY_AVAILABLE:
+            file_filter = self.should_process if per_file_mode else None
+            self.observer = InotifyObserver(file_filter=file_filter)
+        else:
+            self.observer = Observer()
         self.watched_paths: Dict[str, Any] = {}
         self.event_queue: List[WatchEvent] = []
-        self.event_handlers: Dict[WatchEventType, List[Callable]] = {
-            WatchEventType.CREATED: [],
-            WatchEventType.MODIFIED: [],
-            WatchEventType.DELETED: [],
-            WatchEventType.MOVED: []
+        # Handler tuples are replaced, never mutated, so the consumer thread
+        # can iterate them while handlers are added or removed
+        self.event_handlers: Dict[WatchEventType, Tuple[Callable, ...]] = {
+            WatchEventType.CREATED: (),
+            WatchEventType.MODIFIED: (),
+            WatchEventType.DELETED: (),
+            WatchEventType.MOVED: ()
+        }
+        # Handlers added with async_=True run on the worker pool
+        self._async_handlers: Dict[WatchEventType, Tuple[Callable, ...]] = {
+            event_type: () for event_type in self.event_handlers
+        }
+        self._dispatch: Dict[WatchEventType, Callable[[WatchEvent], None]] = {
+            WatchEventType.CREATED: self._handle_created,
+            WatchEventType.MODIFIED: self._handle_modified,
+            WatchEventType.DELETED: self._handle_deleted,
+            WatchEventType.MOVED: self._handle_moved
         }
         
-        self.ignore_patterns: Set[str] = {
+        self.ignore_patterns = {
             '*.pyc', '__pycache__', '.git', '.svn',
             'node_modules', '.DS_Store', 'Thumbs.db'
         }
         
         self.running = False
         self.process_thread = None
-        self.process_lock = threading.Lock()
-        self.pending_events: Dict[Path, WatchEvent] = {}
+        # Observer threads append to _raw_events without locking; only the
+        # consumer thread coalesces them into pending_events
+        self._raw_events: Deque[WatchEvent] = deque()
+        self._events_ready = threading.Event()
+        # Set by stop(); the consumer checks it after every wakeup
+        self._stop_event = threading.Event()
+        self.pending_events: Dict[str, WatchEvent] = {}
+        # Paths deleted in the current batch; a new file there replaces a
+        # document that may still be indexed
+        self.recently_deleted: Set[str] = set()
+        self._last_event_ts = 0.0
+        # Fingerprint of each file's content when it was last indexed
+        self._content_hashes: Dict[str, int] = {}
+        # Files in a debounced batch are scanned concurrently and async
+        # handlers run here; storage and index writes stay on the consumer
+        # thread
+        self._scan_pool: Optional[ThreadPoolExecutor] = self._create_scan_pool()
+        
+    @staticmethod
+    def _create_scan_pool() -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="docscope-scan"
+        )
+        
+    @property
+    def scanner(self) -> Optional[DocumentScanner]:
+        """Scanner used to filter and read changed files"""
+        return self._scanner
+        
+    @scanner.setter
+    def scanner(self, scanner: Optional[DocumentScanner]):
+        self._scanner = scanner
+        self._supported_suffixes = self._load_supported_suffixes(scanner)
+        
+    @staticmethod
+    def _load_supported_suffixes(scanner: Optional[DocumentScanner]) -> Optional[frozenset]:
+        """Get the scanner's supported extensions, if it can list them"""
+        get_formats = getattr(scanner, 'get_supported_formats', None)
+        if get_formats is None:
+            return None
+        try:
+            return frozenset(ext.lower() for ext in get_formats())
+        except TypeError:
+            return None
+        
+    @property
+    def ignore_patterns(self) -> Set[str]:
+        """Glob patterns for paths that should not be processed"""
+        return self._ignore_patterns
+        
+    @ignore_patterns.setter
+    def ignore_patterns(self, patterns: Set[str]):
+        self._ignore_patterns = set(patterns)
+        self._rebuild_ignore_matcher()
+        
+    def _rebuild_ignore_matcher(self):
+        """Recompile the ignore matchers and reset the per-path result cache"""
+        literal_names, glob_patterns = _split_ignore_patterns(self._ignore_patterns)
+        ignore_re = _compile_ignore_patterns(glob_patterns)
+        split_path = _PATH_SEPARATORS.split
+        
+        @lru_cache(maxsize=_IGNORE_CACHE_SIZE)
+        def is_ignored(path_str: str) -> bool:
+            if literal_names and not literal_names.isdisjoint(split_path(path_str)):
+                return True
+            return ignore_re is not None and ignore_re.search(path_str) is not None
+            
+        self._ignore_re = ignore_re
+        self._is_ignored = is_ignored
         
     def watch(self, path: Path, recursive: bool = True) -> bool:
         """Add a path to watch"""
@@ -138,11 +368,12 @@ class FileWatcher:
                 return False
                 
             handler = DocScopeEventHandler(self)
-            self.observer.schedule(handler, str(path), recursive=recursive)
-            
             self.watched_paths[str(path)] = {
                 'recursive': recursive,
-                'handler': handler
+                'handler': handler,
+                'observed_watch': self.observer.schedule(
+                    handler, str(path), recursive=recursive
+                )
             }
             
             logger.info(f"Watching path: {path} (recursive={recursive})")
@@ -158,17 +389,8 @@ class FileWatcher:
             path_str = str(Path(path).resolve())
             
             if path_str in self.watched_paths:
-                # Remove from observer
-                self.observer.unschedule_all()
-                del self.watched_paths[path_str]
-                
-                # Re-add remaining paths
-                for watched_path, info in self.watched_paths.items():
-                    self.observer.schedule(
-                        info['handler'],
-                        watched_path,
-                        recursive=info['recursive']
-                    )
+                info = self.watched_paths.pop(path_str)
+                self.observer.unschedule(info['observed_watch'])
                     
                 logger.info(f"Stopped watching: {path}")
                 return True
@@ -187,6 +409,9 @@ class FileWatcher:
             
         try:
             self.running = True
+            self._stop_event.clear()
+            if self._scan_pool is None:
+                self._scan_pool = self._create_scan_pool()
             self.observer.start()
             
             # Start event processing thread
@@ -210,84 +435,411 @@ class FileWatcher:
             return
             
         self.running = False
+        self._stop_event.set()
+        self._events_ready.set()
         self.observer.stop()
         self.observer.join(timeout=5)
+        # InotifyObserver holds descriptors until closed; watchdog's
+        # Observer has nothing to release
+        close = getattr(self.observer, 'close', None)
+        if close is not None:
+            close()
         
         if self.process_thread:
             self.process_thread.join(timeout=5)
             
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown(wait=False, **_CANCEL_FUTURES)
+            self._scan_pool = None
+            
         logger.info("File watcher stopped")
         
-    def should_process(self, path: Path) -> bool:
+    def should_process(self, path: Union[str, Path]) -> bool:
         """Check if a file should be processed"""
         # Check ignore patterns
-        path_str = str(path)
-        for pattern in self.ignore_patterns:
-            if pattern.replace('*', '') in path_str:
-                return False
+        if self._is_ignored(os.fspath(path)):
+            return False
                 
         # Check file extension
+        if self._supported_suffixes is not None:
+            return os.path.splitext(path)[1].lower() in self._supported_suffixes
         if self.scanner:
             # Use scanner's format detection
-            return self.scanner.detect_format(path) is not None
+            return self.scanner.detect_format(Path(path)) is not None
             
         # Default: process all files
         return True
         
     def handle_event(self, event: WatchEvent):
-        """Handle a watch event"""
-        with self.process_lock:
-            # Debounce events - only keep the latest for each path
-            self.pending_events[event.path] = event
+        """Handle a watch event
+        
+        Runs on observer threads. deque.append is atomic under CPython's
+        GIL, so producers never contend on a lock; debouncing happens in
+        the consumer thread.
+        """
+        self._last_event_ts = time.monotonic()
+        self._raw_events.append(event)
+        self._events_ready.set()
+        
+    def _drain_raw_events(self):
+        """Coalesce queued events into pending_events (consumer thread only)"""
+        raw_events = self._raw_events
+        while raw_events:
+            self._merge_event(raw_events.popleft())
+            
+    def _merge_event(self, event: WatchEvent):
+        """Fold an event into the pending entry for its path
+        
+        Keeps one event per path whose type reflects the net change:
+        created then deleted cancels out, created then modified stays
+        created, modified then deleted becomes deleted, and a move carries
+        the pending state of its source path. A move onto a path with a
+        pending event replaces whatever is stored for that path; the
+        document stored under the destination is removed when the move
+        is applied.
+        """
+        pending = self.pending_events
+        
+        if event.type == WatchEventType.MOVED:
+            source = pending.pop(event.old_path, None)
+            if source is not None:
+                if source.type == WatchEventType.CREATED:
+                    # Never indexed under the old path
+                    event = replace(event, type=WatchEventType.CREATED, old_path=None)
+                elif source.type == WatchEventType.MOVED:
+                    event = replace(event, old_path=source.old_path)
+                    
+            replaced = pending.get(event.path)
+            if replaced is not None and replaced.type == WatchEventType.MOVED:
+                # The file moved here earlier is overwritten, and its
+                # document is still stored under that move's source
+                stale = replaced.old_path
+                previous = pending.get(stale)
+                if previous is None or previous.type == WatchEventType.DELETED:
+                    pending[stale] = WatchEvent(WatchEventType.DELETED, stale)
+                    self.recently_deleted.add(stale)
+                else:
+                    # A new file at the source path takes over the document
+                    pending[stale] = replace(previous, type=WatchEventType.MODIFIED)
+            elif event.type == WatchEventType.CREATED and (
+                event.path in self.recently_deleted
+                or (replaced is not None and replaced.type != WatchEventType.CREATED)
+            ):
+                # The destination still has a stored document to update
+                event = replace(event, type=WatchEventType.MODIFIED)
+            pending[event.path] = event
+            return
             
-    def _process_events(self):
-        """Process pending events (runs in separate thread)"""
-        while self.running:
-            time.sleep(self.debounce_seconds)
+        previous = pending.get(event.path)
+        
+        if event.type == WatchEventType.DELETED:
+            if previous is None:
+                self.recently_deleted.add(event.path)
+            elif previous.type == WatchEventType.CREATED:
+                del pending[event.path]
+                return
+            elif previous.type == WatchEventType.MOVED:
+                # The document is still stored under the move's source
+                del pending[event.path]
+                event = replace(event, path=previous.old_path)
+                self.recently_deleted.add(event.path)
+            else:
+                self.recently_deleted.add(event.path)
+            pending[event.path] = event
+            return
             
-            with self.process_lock:
-                if not self.pending_events:
-                    continue
-                    
-                # Process all pending events
-                events = list(self.pending_events.values())
-                self.pending_events.clear()
+        if previous is None:
+            if event.type == WatchEventType.CREATED and event.path in self.recently_deleted:
+                event = replace(event, type=WatchEventType.MODIFIED)
+            pending[event.path] = event
+        elif previous.type in (WatchEventType.CREATED, WatchEventType.MOVED):
+            # The pending handler scans the file's latest contents anyway
+            return
+        else:
+            # Modified or deleted followed by created or modified
+            if event.type != WatchEventType.MODIFIED:
+                event = replace(event, type=WatchEventType.MODIFIED)
+            pending[event.path] = event
+            
+    def _process_events(self):
+        """Process pending events (runs in separate thread)
+        
+        Waits on _events_ready, which stop() also sets, so shutdown never
+        waits out a debounce interval.
+        """
+        stopped = self._stop_event.is_set
+        while True:
+            # Sleep until the first event of a batch arrives
+            self._events_ready.wait()
+            if stopped():
+                return
+            first_event_ts = time.monotonic()
+            
+            # Coalesce until the path goes quiet or the batch window closes
+            while not stopped():
+                self._events_ready.clear()
+                self._drain_raw_events()
+                deadline = self._last_event_ts + self.debounce_seconds
+                if self.max_batch_window is not None:
+                    deadline = min(deadline, first_event_ts + self.max_batch_window)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._events_ready.wait(remaining)
                 
+            if stopped():
+                return
+                
+            # Process all pending events
+            self._drain_raw_events()
+            events = list(self.pending_events.values())
+            self.pending_events.clear()
+            self.recently_deleted.clear()
+            
+            if events:
+                self._process_batch(events)
+                
+    def _process_batch(self, events: List[WatchEvent]):
+        """Process a debounced batch of events
+        
+        When the storage backend offers bulk methods the whole batch is
+        written with one call per operation; otherwise events are handled
+        one at a time.
+        """
+        if not self._storage_supports_batches():
             for event in events:
+                if self._stop_event.is_set():
+                    return
                 try:
                     self._process_single_event(event)
                 except Exception as e:
-                    logger.error(f"Error processing event {event}: {e}")
+                    logger.error("Error processing event %s: %s", event, e)
+            return
+            
+        for event in events:
+            self._run_handlers(event)
+            
+        try:
+            self._apply_batch(events)
+        except Exception as e:
+            logger.error("Failed to index batch of %d events: %s", len(events), e)
+            for event in events:
+                self._content_hashes.pop(event.path, None)
+            
+    def _storage_supports_batches(self) -> bool:
+        """Check whether the storage backend exposes the bulk write methods"""
+        return self.storage is not None and all(
+            callable(getattr(self.storage, name, None))
+            for name in _BATCH_STORAGE_METHODS
+        )
+        
+    def _apply_batch(self, events: List[WatchEvent]):
+        """Write the storage and search changes for a batch of events
+        
+        Scan results are turned into Documents before anything is written,
+        so a file that cannot be read leaves the rest of the batch intact.
+        """
+        creates: List[Document] = []
+        updates: Dict[str, Dict[str, Any]] = {}
+        deleted_ids: List[str] = []
+        # Fingerprints of the files written by this batch, recorded once
+        # the batch has been stored and indexed
+        digests: Dict[str, int] = {}
+        scanned = self._scan_batch(events)
+        
+        for event in events:
+            if event.type == WatchEventType.DELETED:
+                self._content_hashes.pop(event.path, None)
+                document = self.storage.get_document_by_path(event.path_str)
+                if document:
+                    deleted_ids.append(document.id)
+                    
+            elif event.type == WatchEventType.MOVED:
+                self._content_hashes.pop(event.old_path, None)
+                document = self.storage.get_document_by_path(event.old_path_str)
+                if document:
+                    # A file renamed over another replaces its document
+                    replaced = self.storage.get_document_by_path(event.path_str)
+                    if replaced and replaced.id != document.id:
+                        self._content_hashes.pop(event.path, None)
+                        deleted_ids.append(replaced.id)
+                    update_data = {'path': event.path_str}
+                    result, _ = scanned.get(event.path, (None, None))
+                    if result:
+                        update_data.update(result)
+                    updates[document.id] = update_data
                     
+            elif self.scanner:
+                result, digest = scanned.get(event.path, (None, None))
+                if not result:
+                    continue
+                existing = None
+                if event.type == WatchEventType.MODIFIED:
+                    existing = self.storage.get_document_by_path(event.path_str)
+                if existing:
+                    updates[existing.id] = result
+                else:
+                    try:
+                        creates.append(_scan_result_to_document(event.path_str, result))
+                    except (OSError, TypeError, ValueError) as e:
+                        logger.error("Failed to read scanned file %s: %s", event.path, e)
+                        continue
+                if digest is not None:
+                    digests[event.path] = digest
+                    
+        created_ids: List[str] = []
+        if deleted_ids:
+            self.storage.delete_documents(deleted_ids)
+        if updates:
+            self.storage.update_documents(updates)
+        if creates:
+            created_ids = self.storage.store_documents(creates)
+            
+        if self.search_index:
+            self._index_batch(created_ids, list(updates), deleted_ids)
+        self._content_hashes.update(digests)
+            
+        logger.info(
+            "Auto-indexed batch: %d created, %d updated, %d deleted",
+            len(creates), len(updates), len(deleted_ids)
+        )
+        
+    def _index_batch(
+        self,
+        created_ids: List[str],
+        updated_ids: List[str],
+        deleted_ids: List[str]
+    ):
+        """Apply a batch to the search index, in one commit when supported
+        
+        Created and updated documents are read back from storage, so the
+        index gets the complete stored document even when only part of it,
+        such as the path of a moved file, changed.
+        """
+        created = self._fetch_documents(created_ids)
+        updated = {doc.id: doc for doc in self._fetch_documents(updated_ids)}
+        
+        batch_writer = getattr(self.search_index, 'batch_writer', None)
+        if callable(batch_writer):
+            with batch_writer() as writer:
+                writer.delete_many(deleted_ids)
+                writer.update_many(updated)
+                writer.add_many(created)
+            return
+            
+        for doc_id in deleted_ids:
+            self.search_index.delete_document(doc_id)
+        for document in (*updated.values(), *created):
+            self.search_index.index_document(document)
+            
+    def _fetch_documents(self, doc_ids: List[str]) -> List[Document]:
+        """Load stored documents by ID, skipping any that no longer exist"""
+        documents = []
+        for doc_id in doc_ids:
+            document = self.storage.get_document(doc_id)
+            if document is not None:
+                documents.append(document)
+        return documents
+            
+    def _scan_batch(
+        self, events: List[WatchEvent]
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[int]]]:
+        """Scan every file touched by a batch, keyed by event path
+        
+        Each value is the scan result and the file's fingerprint, as
+        returned by _scan. Deletions need no scan. The remaining files are read on the scan
+        pool so their I/O overlaps.
+        """
+        if not self.scanner:
+            return {}
+            
+        to_scan = [event for event in events if event.type != WatchEventType.DELETED]
+        pool = self._scan_pool
+        if pool is None or len(to_scan) < 2:
+            results = map(self._scan, to_scan)
+        else:
+            results = pool.map(self._scan, to_scan)
+            
+        return {event.path: result for event, result in zip(to_scan, results)}
+        
+    def _scan(self, event: WatchEvent) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """Scan the file behind an event, logging failures
+        
+        Returns the scan result and the file's fingerprint. The result is
+        None for a modified file whose content has not changed and for a
+        file that could not be scanned.
+        """
+        digest = self._content_digest(event)
+        if self._content_unchanged(event, digest):
+            return None, None
+        try:
+            return self.scanner.scan_file(event.path_obj), digest
+        except Exception as e:
+            logger.error("Failed to scan %s: %s", event.path, e)
+            return None, None
+            
+    @staticmethod
+    def _content_digest(event: WatchEvent) -> Optional[int]:
+        """Fingerprint the file behind a created or modified event"""
+        if event.type not in (WatchEventType.CREATED, WatchEventType.MODIFIED):
+            return None
+        return _fingerprint(event.path)
+        
+    def _content_unchanged(self, event: WatchEvent, digest: Optional[int]) -> bool:
+        """Check whether a modified file still has the content last indexed
+        
+        Fingerprints are only recorded once a file has been stored, so a
+        failed scan never hides the next change.
+        """
+        return (
+            event.type == WatchEventType.MODIFIED
+            and digest is not None
+            and self._content_hashes.get(event.path) == digest
+        )
+        
+    def _run_handlers(self, event: WatchEvent):
+        """Call the registered handlers for an event
+        
+        Async handlers are submitted to the worker pool without waiting for
+        them, so a slow handler never holds up the consumer thread.
+        """
+        pool = self._scan_pool
+        for handler in self._async_handlers[event.type]:
+            try:
+                pool.submit(self._call_handler, handler, event)
+            except (AttributeError, RuntimeError):
+                # No pool, or it was shut down by stop()
+                self._call_handler(handler, event)
+                
+        for handler in self.event_handlers[event.type]:
+            self._call_handler(handler, event)
+                
+    @staticmethod
+    def _call_handler(handler: Callable, event: WatchEvent):
+        try:
+            handler(event)
+        except Exception as e:
+            logger.error("Handler error: %s", e)
+            
     def _process_single_event(self, event: WatchEvent):
         """Process a single watch event"""
-        logger.debug(f"Processing event: {event.type} for {event.path}")
+        logger.debug("Processing event: %s for %s", event.type, event.path)
         
         # Call registered handlers
-        for handler in self.event_handlers[event.type]:
-            try:
-                handler(event)
-            except Exception as e:
-                logger.error(f"Handler error: {e}")
+        self._run_handlers(event)
                 
         # Auto-index if components are available
-        if event.type == WatchEventType.CREATED:
-            self._handle_created(event)
-        elif event.type == WatchEventType.MODIFIED:
-            self._handle_modified(event)
-        elif event.type == WatchEventType.DELETED:
-            self._handle_deleted(event)
-        elif event.type == WatchEventType.MOVED:
-            self._handle_moved(event)
+        self._dispatch[event.type](event)
             
     def _handle_created(self, event: WatchEvent):
         """Handle file creation"""
         if not self.scanner or not self.storage:
             return
             
+        digest = self._content_digest(event)
         try:
             # Scan the new file
-            result = self.scanner.scan_file(event.path)
+            result = self.scanner.scan_file(event.path_obj)
             
             if result:
                 # Store in database
@@ -297,23 +849,33 @@ class FileWatcher:
                 if self.search_index and document:
                     self.search_index.index_document(document)
                     
-                logger.info(f"Auto-indexed new file: {event.path}")
+                # Remember the content so a later no-op write is skipped
+                if digest is not None:
+                    self._content_hashes[event.path] = digest
+                logger.info("Auto-indexed new file: %s", event.path)
                 
         except Exception as e:
-            logger.error(f"Failed to index new file {event.path}: {e}")
+            self._content_hashes.pop(event.path, None)
+            logger.error("Failed to index new file %s: %s", event.path, e)
             
     def _handle_modified(self, event: WatchEvent):
         """Handle file modification"""
         if not self.scanner or not self.storage:
             return
             
+        # Editors often rewrite files without changing them
+        digest = self._content_digest(event)
+        if self._content_unchanged(event, digest):
+            logger.debug("Skipping unchanged file: %s", event.path)
+            return
+            
         try:
             # Re-scan the file
-            result = self.scanner.scan_file(event.path)
+            result = self.scanner.scan_file(event.path_obj)
             
             if result:
                 # Update in database
-                existing = self.storage.get_document_by_path(str(event.path))
+                existing = self.storage.get_document_by_path(event.path_str)
                 
                 if existing:
                     # Update existing document
@@ -329,19 +891,23 @@ class FileWatcher:
                     if self.search_index and document:
                         self.search_index.index_document(document)
                         
-                logger.info(f"Auto-indexed modified file: {event.path}")
+                if digest is not None:
+                    self._content_hashes[event.path] = digest
+                logger.info("Auto-indexed modified file: %s", event.path)
                 
         except Exception as e:
-            logger.error(f"Failed to index modified file {event.path}: {e}")
+            self._content_hashes.pop(event.path, None)
+            logger.error("Failed to index modified file %s: %s", event.path, e)
             
     def _handle_deleted(self, event: WatchEvent):
         """Handle file deletion"""
         if not self.storage:
             return
             
+        self._content_hashes.pop(event.path, None)
         try:
             # Find document in database
-            document = self.storage.get_document_by_path(str(event.path))
+            document = self.storage.get_document_by_path(event.path_str)
             
             if document:
                 # Remove from search index
@@ -351,27 +917,36 @@ class FileWatcher:
                 # Remove from database
                 self.storage.delete_document(document.id)
                 
-                logger.info(f"Removed deleted file from index: {event.path}")
+                logger.info("Removed deleted file from index: %s", event.path)
                 
         except Exception as e:
-            logger.error(f"Failed to remove deleted file {event.path}: {e}")
+            logger.error("Failed to remove deleted file %s: %s", event.path, e)
             
     def _handle_moved(self, event: WatchEvent):
         """Handle file move/rename"""
         if not self.storage:
             return
             
+        self._content_hashes.pop(event.old_path, None)
         try:
             # Find document by old path
-            document = self.storage.get_document_by_path(str(event.old_path))
+            document = self.storage.get_document_by_path(event.old_path_str)
             
             if document:
+                # A file renamed over another replaces its document
+                replaced = self.storage.get_document_by_path(event.path_str)
+                if replaced and replaced.id != document.id:
+                    self._content_hashes.pop(event.path, None)
+                    self.storage.delete_document(replaced.id)
+                    if self.search_index:
+                        self.search_index.delete_document(replaced.id)
+                        
                 # Update path
-                update_data = {'path': str(event.path)}
+                update_data = {'path': event.path_str}
                 
                 # Re-scan if scanner available
                 if self.scanner:
-                    result = self.scanner.scan_file(event.path)
+                    result = self.scanner.scan_file(event.path_obj)
                     if result:
                         update_data.update(result)
                         
@@ -382,19 +957,28 @@ class FileWatcher:
                 if self.search_index:
                     self.search_index.update_document(document.id, update_data)
                     
-                logger.info(f"Updated moved file: {event.old_path} -> {event.path}")
+                logger.info("Updated moved file: %s -> %s", event.old_path, event.path)
                 
         except Exception as e:
-            logger.error(f"Failed to update moved file: {e}")
+            logger.error("Failed to update moved file: %s", e)
             
-    def add_handler(self, event_type: WatchEventType, handler: Callable):
-        """Add an event handler"""
-        self.event_handlers[event_type].append(handler)
+    def add_handler(self, event_type: WatchEventType, handler: Callable, async_: bool = False):
+        """Add an event handler
+        
+        With async_=True the handler runs on the worker pool, fire and forget,
+        instead of on the consumer thread before the event is indexed.
+        """
+        registry = self._async_handlers if async_ else self.event_handlers
+        registry[event_type] += (handler,)
         
     def remove_handler(self, event_type: WatchEventType, handler: Callable):
         """Remove an event handler"""
-        if handler in self.event_handlers[event_type]:
-            self.event_handlers[event_type].remove(handler)
+        for registry in (self.event_handlers, self._async_handlers):
+            handlers = registry[event_type]
+            if handler in handlers:
+                index = handlers.index(handler)
+                registry[event_type] = handlers[:index] + handlers[index + 1:]
+                return
             
     def set_ignore_patterns(self, patterns: Set[str]):
         """Set ignore patterns"""
@@ -405,6 +989,6 @@ class FileWatcher:
         return {
             'running': self.running,
             'watched_paths': list(self.watched_paths.keys()),
-            'pending_events': len(self.pending_events),
+            'pending_events': len(self.pending_events) + len(self._raw_events),
             'ignore_patterns': list(self.ignore_patterns)
         }
\ No newline at end of file
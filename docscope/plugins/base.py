@@ -1,7 +1,7 @@
 """Plugin base classes and interfaces"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -68,6 +68,34 @@ class PluginMetadata:
     max_docscope_version: Optional[str] = None
 
 
+def _compile_schema(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Compile a config schema into a validator
+    The validator returns the first error message, or None if the config is valid
+    """
+    # Keys that are neither required nor typed never fail validation
+    rules = tuple(
+        (key, spec.get('required', False), spec.get('type'))
+        for key, spec in schema.items()
+        if spec.get('required', False) or spec.get('type')
+    )
+    
+    def validate(config: Dict[str, Any]) -> Optional[str]:
+        for key, required, expected_type in rules:
+            if key in config:
+                value = config[key]
+                if expected_type and not isinstance(value, expected_type):
+                    return (
+                        f"Configuration key {key} has wrong type. "
+                        f"Expected {expected_type}, got {type(value)}"
+                    )
+            elif required:
+                return f"Required configuration key missing: {key}"
+        return None
+    
+    return validate
+
+
 class Plugin(ABC):
     """Base class for DocScope plugins"""
     
@@ -76,9 +104,12 @@ class Plugin(ABC):
         self.config = config or {}
         self.logger = logging.getLogger(self.__class__.__name__)
         self.enabled = True
-        self._hooks = {}
+        # Hook handlers are kept as tuples that are replaced on registration,
+        # so dispatchers can iterate a snapshot without copying
+        self._hooks: Dict[PluginHook, Tuple[Callable, ...]] = {}
         self._commands = {}
         self._api_routes = []
+        self._validator = None
         
     @abstractmethod
     def get_metadata(self) -> PluginMetadata:
@@ -103,38 +134,22 @@ class Plugin(ABC):
         Validate plugin configuration
         Returns True if configuration is valid
         """
-        metadata = self.get_metadata()
-        schema = metadata.config_schema
-        
-        if not schema:
-            return True
+        # The schema is compiled on first use; metadata is static per plugin
+        if self._validator is None:
+            self._validator = _compile_schema(self.get_metadata().config_schema)
         
-        # Basic validation
-        for key, spec in schema.items():
-            required = spec.get('required', False)
-            if required and key not in self.config:
-                self.logger.error(f"Required configuration key missing: {key}")
-                return False
-            
-            if key in self.config:
-                value = self.config[key]
-                expected_type = spec.get('type')
-                if expected_type and not isinstance(value, expected_type):
-                    self.logger.error(
-                        f"Configuration key {key} has wrong type. "
-                        f"Expected {expected_type}, got {type(value)}"
-                    )
-                    return False
+        error = self._validator(self.config)
+        if error:
+            self.logger.error(error)
+            return False
         
         return True
     
     def register_hook(self, hook: PluginHook, handler: Callable) -> None:
         """Register a hook handler"""
-        if hook not in self._hooks:
-            self._hooks[hook] = []
-        self._hooks[hook].append(handler)
+        self._hooks[hook] = self._hooks.get(hook, ()) + (handler,)
     
-    def get_hooks(self) -> Dict[PluginHook, List[Callable]]:
+    def get_hooks(self) -> Dict[PluginHook, Tuple[Callable, ...]]:
         """Get all registered hooks"""
         return self._hooks
     
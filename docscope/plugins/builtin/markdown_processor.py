@@ -1,13 +1,99 @@
 """Markdown Processor Plugin for DocScope"""
 
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import logging
 
 from ..base import ProcessorPlugin, PluginMetadata, PluginCapability, PluginHook
 
+# The regex module is optional; unlike re it can stop a match that runs
+# too long on adversarial input
+try:
+    import regex
+except ImportError:
+    regex = None
+
 logger = logging.getLogger(__name__)
 
+# Documents longer than this many characters are only analysed up to it
+_MAX_CONTENT_LENGTH = 10 * 1024 * 1024
+
+# Seconds a single extraction pass may run when the regex module is used
+_REGEX_TIMEOUT = 0.5
+
+# Compiled patterns, shared by all plugin instances
+_PATTERN_CACHE: Dict[Tuple[str, int], 're.Pattern'] = {}
+
+
+def _get_pattern(pattern: str, flags: int = 0) -> 're.Pattern':
+    """Return a compiled pattern, compiling it on first use
+    
+    Patterns are compiled with the regex module when it is installed so
+    ``_finditer`` can bound their running time.
+    """
+    key = (pattern, flags)
+    compiled = _PATTERN_CACHE.get(key)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[key] = (regex or re).compile(pattern, flags)
+    return compiled
+
+
+def _finditer(pattern: 're.Pattern', text: str):
+    """Iterate over matches, raising TimeoutError after _REGEX_TIMEOUT
+    
+    Without the regex module there is no timeout.
+    """
+    if regex is not None:
+        return pattern.finditer(text, timeout=_REGEX_TIMEOUT)
+    return pattern.finditer(text)
+
+
+# Patterns are compiled once at import time
+_HEADER_RE = _get_pattern(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+# Markdown links [text](url), reference links [ref]: url and plain URLs,
+# matched in one pass; the named group that matched holds the link
+_LINK_RE = _get_pattern(
+    r'\[[^\]]+\]\((?P<inline>[^\)]+)\)'
+    r'|^\[[^\]]+\]:\s+(?P<reference>.+)$'
+    r'|(?P<url>https?://[^\s<>"{}|\\^`\[\]]+)',
+    re.MULTILINE
+)
+_FENCED_RE = _get_pattern(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
+_ANCHOR_NONWORD_RE = re.compile(r'[^\w\s-]')
+_ANCHOR_WS_RE = re.compile(r'\s+')
+
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Words are counted in slices of about this many characters
+_WORD_COUNT_CHUNK = 64 * 1024
+
+# Deletes the ASCII characters _ANCHOR_NONWORD_RE would remove, so ASCII
+# headers are slugified without the regex engine
+_ANCHOR_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128))
+    if not (c.isalnum() or c.isspace() or c in '_-')
+))
+
+
+def _count_words(text: str, start: int, end: int) -> int:
+    """Count the whitespace-separated words in ``text[start:end]``
+    
+    The range is split at whitespace into bounded chunks, so counting never
+    materializes a copy or a word list of the whole range.
+    """
+    count = 0
+    while start < end:
+        stop = start + _WORD_COUNT_CHUNK
+        if stop < end:
+            # Extend the chunk to the next whitespace so no word is cut
+            match = _WHITESPACE_RE.search(text, stop, end)
+            stop = match.start() if match else end
+        else:
+            stop = end
+        count += len(text[start:stop].split())
+        start = stop
+    return count
+
 
 class MarkdownProcessorPlugin(ProcessorPlugin):
     """Plugin for processing and enhancing Markdown documents"""
@@ -18,6 +104,16 @@ class MarkdownProcessorPlugin(ProcessorPlugin):
         self.extract_links = config.get('extract_links', True) if config else True
         self.extract_code_blocks = config.get('extract_code_blocks', True) if config else True
         self.add_reading_time = config.get('add_reading_time', True) if config else True
+        self.max_content_length = (
+            config.get('max_content_length', _MAX_CONTENT_LENGTH) if config else _MAX_CONTENT_LENGTH
+        )
+        
+        # Imported once here rather than for every document with front matter
+        try:
+            import yaml
+            self._yaml = yaml
+        except ImportError:
+            self._yaml = None
     
     def get_metadata(self) -> PluginMetadata:
         """Return plugin metadata"""
@@ -49,6 +145,11 @@ class MarkdownProcessorPlugin(ProcessorPlugin):
                     'type': bool,
                     'default': True,
                     'description': 'Calculate estimated reading time'
+                },
+                'max_content_length': {
+                    'type': int,
+                    'default': _MAX_CONTENT_LENGTH,
+                    'description': 'Characters of a document analysed for metadata'
                 }
             }
         )
@@ -74,44 +175,59 @@ class MarkdownProcessorPlugin(ProcessorPlugin):
             return document
         
         content = document.get('content', '')
-        metadata = document.get('metadata', {})
+        # Metadata is filled in place, so the document only needs writing
+        # back when the front matter is stripped from its content
+        metadata = document.setdefault('metadata', {})
+        
+        # Only a bounded prefix of very large documents is analysed, which
+        # caps the work the regex passes can do
+        text = content
+        if len(content) > self.max_content_length:
+            logger.warning(
+                f"Markdown document {document.get('title', 'untitled')} has {len(content)} "
+                f"characters, analysing the first {self.max_content_length}"
+            )
+            text = content[:self.max_content_length]
+        
+        # Each extractor is skipped when a substring check shows its patterns
+        # cannot match, which keeps plain prose off the regex engine
         
         # Extract table of contents
-        if self.extract_toc:
-            toc = self._extract_toc(content)
+        if self.extract_toc and '#' in text:
+            toc = self._extract_toc(text)
             if toc:
                 metadata['table_of_contents'] = toc
         
         # Extract links
-        if self.extract_links:
-            links = self._extract_links(content)
-            if links:
-                metadata['links'] = links
-                metadata['external_links'] = [l for l in links if l.startswith('http')]
-                metadata['internal_links'] = [l for l in links if not l.startswith('http')]
+        if self.extract_links and ('[' in text or 'http' in text):
+            external_links, internal_links = self._extract_links(text)
+            if external_links or internal_links:
+                metadata['links'] = external_links + internal_links
+                metadata['external_links'] = external_links
+                metadata['internal_links'] = internal_links
         
         # Extract code blocks
-        if self.extract_code_blocks:
-            code_blocks = self._extract_code_blocks(content)
+        code_spans = None
+        if self.extract_code_blocks and '```' in text:
+            code_blocks, code_spans = self._extract_code_blocks(text)
             if code_blocks:
                 metadata['code_blocks'] = code_blocks
                 metadata['languages'] = list(set(cb.get('language', 'plain') for cb in code_blocks))
         
         # Calculate reading time
         if self.add_reading_time:
-            reading_time = self._calculate_reading_time(content)
+            reading_time = self._calculate_reading_time(text, code_spans)
             metadata['reading_time_minutes'] = reading_time
         
         # Extract front matter if present
-        front_matter = self._extract_front_matter(content)
+        if content.startswith('---\n'):
+            front_matter, front_matter_end = self._extract_front_matter(content)
+        else:
+            front_matter, front_matter_end = None, 0
         if front_matter:
             metadata['front_matter'] = front_matter
             # Remove front matter from content
-            content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
-        
-        # Update document
-        document['content'] = content
-        document['metadata'] = metadata
+            document['content'] = content[front_matter_end:]
         
         logger.debug(f"Processed Markdown document: {document.get('title', 'untitled')}")
         return document
@@ -123,85 +239,140 @@ class MarkdownProcessorPlugin(ProcessorPlugin):
     def _extract_toc(self, content: str) -> List[Dict[str, Any]]:
         """Extract table of contents from headers"""
         toc = []
-        header_pattern = r'^(#{1,6})\s+(.+)$'
-        
-        for match in re.finditer(header_pattern, content, re.MULTILINE):
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            anchor = re.sub(r'[^\w\s-]', '', title.lower())
-            anchor = re.sub(r'\s+', '-', anchor)
-            
-            toc.append({
-                'level': level,
-                'title': title,
-                'anchor': anchor
-            })
+        # Bound methods are looked up once rather than for every header
+        append = toc.append
+        make_anchor = self._make_anchor
+        
+        try:
+            for match in _finditer(_HEADER_RE, content):
+                marks, title = match.groups()
+                title = title.strip()
+                
+                append({
+                    'level': len(marks),
+                    'title': title,
+                    'anchor': make_anchor(title)
+                })
+        except TimeoutError:
+            logger.warning("Timed out extracting table of contents, keeping partial result")
         
         return toc
     
-    def _extract_links(self, content: str) -> List[str]:
-        """Extract all links from Markdown content"""
-        links = []
+    def _make_anchor(self, title: str) -> str:
+        """Turn a header title into a URL anchor"""
+        anchor = title.lower()
+        if anchor.isascii():
+            anchor = anchor.translate(_ANCHOR_TABLE)
+        else:
+            anchor = _ANCHOR_NONWORD_RE.sub('', anchor)
         
-        # Markdown links [text](url)
-        md_link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        for match in re.finditer(md_link_pattern, content):
-            links.append(match.group(2))
+        # Each run of whitespace becomes a dash; split() drops runs at the
+        # ends, which only appear when punctuation next to them was removed
+        if anchor[:1].isspace() or anchor[-1:].isspace():
+            return _ANCHOR_WS_RE.sub('-', anchor)
+        return '-'.join(anchor.split())
+    
+    def _extract_links(self, content: str) -> Tuple[List[str], List[str]]:
+        """Extract all links from Markdown content
         
-        # Reference links [text][ref]
-        ref_link_pattern = r'^\[([^\]]+)\]:\s+(.+)$'
-        for match in re.finditer(ref_link_pattern, content, re.MULTILINE):
-            links.append(match.group(2))
+        Returns the external and internal links, each without duplicates.
+        """
+        # Links are classified as they are found; the sets remove duplicates
+        external = set()
+        internal = set()
+        add_external = external.add
+        add_internal = internal.add
         
-        # Plain URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        for match in re.finditer(url_pattern, content):
-            links.append(match.group(0))
+        try:
+            for match in _finditer(_LINK_RE, content):
+                link = match.group(match.lastgroup)
+                if link.startswith('http'):
+                    add_external(link)
+                else:
+                    add_internal(link)
+        except TimeoutError:
+            logger.warning("Timed out extracting links, keeping partial result")
         
-        return list(set(links))  # Remove duplicates
+        return list(external), list(internal)
     
-    def _extract_code_blocks(self, content: str) -> List[Dict[str, str]]:
-        """Extract code blocks from Markdown"""
+    def _extract_code_blocks(self, content: str) -> Tuple[List[Dict[str, str]], List[Tuple[int, int]]]:
+        """Extract code blocks from Markdown
+        
+        Returns the code blocks and their (start, end) offsets in the content.
+        """
         code_blocks = []
+        spans = []
+        append_block = code_blocks.append
+        append_span = spans.append
         
         # Fenced code blocks ```language\ncode\n```
-        fenced_pattern = r'```(\w+)?\n(.*?)\n```'
-        for match in re.finditer(fenced_pattern, content, re.DOTALL):
-            language = match.group(1) or 'plain'
-            code = match.group(2)
-            code_blocks.append({
-                'language': language,
-                'code': code,
-                'lines': len(code.splitlines())
-            })
-        
-        return code_blocks
-    
-    def _extract_front_matter(self, content: str) -> Dict[str, Any]:
-        """Extract YAML front matter from Markdown"""
-        front_matter_pattern = r'^---\n(.*?)\n---'
-        match = re.match(front_matter_pattern, content, re.DOTALL)
-        
-        if match:
-            try:
-                import yaml
-                return yaml.safe_load(match.group(1))
-            except Exception as e:
-                logger.warning(f"Failed to parse front matter: {e}")
-                return {}
-        
-        return {}
-    
-    def _calculate_reading_time(self, content: str) -> int:
-        """Calculate estimated reading time in minutes"""
+        try:
+            for match in _finditer(_FENCED_RE, content):
+                language, code = match.groups()
+                append_block({
+                    'language': language or 'plain',
+                    'code': code,
+                    'lines': len(code.splitlines())
+                })
+                append_span(match.span())
+        except TimeoutError:
+            logger.warning("Timed out extracting code blocks, keeping partial result")
+        
+        return code_blocks, spans
+    
+    def _extract_front_matter(self, content: str) -> Tuple[Dict[str, Any], int]:
+        """Extract YAML front matter from Markdown
+        
+        Returns the parsed data and the offset where the document body starts.
+        """
+        # Delimiters are located with str.find, which cannot backtrack over
+        # the document when the closing '---' is missing
+        if not content.startswith('---\n'):
+            return None, 0
+        
+        end = content.find('\n---', 4)
+        if end < 0:
+            return None, 0
+        
+        body_start = end + 4
+        if content.startswith('\n', body_start):
+            body_start += 1
+        
+        if self._yaml is None:
+            logger.warning("Failed to parse front matter: PyYAML not installed")
+            return {}, 0
+        
+        try:
+            return self._yaml.safe_load(content[4:end]), body_start
+        except Exception as e:
+            logger.warning(f"Failed to parse front matter: {e}")
+            return {}, 0
+    
+    def _calculate_reading_time(self, content: str,
+                                code_spans: List[Tuple[int, int]] = None) -> int:
+        """Calculate estimated reading time in minutes
+        
+        ``code_spans`` are the code block offsets found by
+        ``_extract_code_blocks``; they are located here when not given.
+        """
         # Average reading speed: 200-250 words per minute
         words_per_minute = 225
         
-        # Remove code blocks for more accurate count
-        text_content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
+        if code_spans is None:
+            code_spans = []
+            if '```' in content:
+                try:
+                    code_spans.extend(m.span() for m in _finditer(_FENCED_RE, content))
+                except TimeoutError:
+                    logger.warning("Timed out locating code blocks, counting them as text")
         
-        # Count words
-        word_count = len(text_content.split())
+        # Count words outside code blocks for more accurate count
+        word_count = 0
+        last = 0
+        for start, end in code_spans:
+            word_count += _count_words(content, last, start)
+            last = end
+        word_count += _count_words(content, last, len(content))
         
         # Calculate reading time (minimum 1 minute)
         reading_time = max(1, round(word_count / words_per_minute))
@@ -1,6 +1,9 @@
 """Slack Notifier Plugin for DocScope"""
 
 import json
+import queue
+import threading
+import time
 from typing import Dict, Any, List
 import logging
 from urllib.parse import urlencode
@@ -8,8 +11,47 @@ from urllib.request import Request, urlopen
 
 from ..base import NotificationPlugin, PluginMetadata, PluginCapability, PluginHook
 
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# orjson is optional; it serializes straight to UTF-8 bytes in native code
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for Slack before giving up on a request
+_HTTP_TIMEOUT = 5.0
+
+# Notifications waiting to be sent; further ones are dropped when full
+_QUEUE_SIZE = 1024
+# Seconds shutdown() waits for queued notifications to be sent
+_SHUTDOWN_TIMEOUT = 10.0
+
+# Queued to stop the sender thread
+_SENTINEL = object()
+
+# Attachment color for each notification level
+_LEVEL_COLORS = {
+    'info': '#36a64f',     # Green
+    'warning': '#ff9900',   # Orange
+    'error': '#ff0000',     # Red
+    'success': '#36a64f'    # Green
+}
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload to compact UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
 
 class SlackNotifierPlugin(NotificationPlugin):
     """Plugin for sending notifications to Slack"""
@@ -20,6 +62,10 @@ class SlackNotifierPlugin(NotificationPlugin):
         self.channel = config.get('channel', '#general') if config else '#general'
         self.username = config.get('username', 'DocScope') if config else 'DocScope'
         self.icon_emoji = config.get('icon_emoji', ':books:') if config else ':books:'
+        self._http = None
+        self._queue = None
+        self._sender = None
+        self._payload_prefix = None
     
     def get_metadata(self) -> PluginMetadata:
         """Return plugin metadata"""
@@ -67,6 +113,48 @@ class SlackNotifierPlugin(NotificationPlugin):
             logger.error("Slack webhook URL not configured")
             return False
         
+        # Keep the connection to Slack alive between notifications so each
+        # one does not pay for a new TCP and TLS handshake
+        if urllib3 is not None:
+            self._http = urllib3.PoolManager(
+                num_pools=1,
+                maxsize=4,
+                timeout=_HTTP_TIMEOUT,
+                # A webhook POST is not idempotent: Slack may have posted the
+                # message before a 5xx or a dropped response, so only
+                # connection failures and rate limiting (429, honoring
+                # Retry-After) are retried
+                retries=urllib3.Retry(
+                    total=3,
+                    read=0,
+                    other=0,
+                    backoff_factor=0.2,
+                    status_forcelist=(429,),
+                    allowed_methods=frozenset(['POST']),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            )
+        
+        # Everything up to the attachment color is the same for every
+        # notification without per-call options, so it is serialized once
+        self._payload_prefix = (
+            '{"channel":%s,"username":%s,"icon_emoji":%s,"attachments":[{"color":' % (
+                json.dumps(self.channel), json.dumps(self.username), json.dumps(self.icon_emoji)
+            )
+        ).encode('utf-8')
+        
+        # Notifications are sent from a background thread so a slow Slack
+        # response never holds up scanning or indexing
+        self._queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._sender = threading.Thread(
+            target=self._send_worker,
+            args=(self._queue,),
+            name="docscope-slack",
+            daemon=True
+        )
+        self._sender.start()
+        
         # Register hooks
         self.register_hook(PluginHook.AFTER_SCAN, self.notify_scan_complete)
         self.register_hook(PluginHook.AFTER_INDEX, self.notify_index_complete)
@@ -77,52 +165,88 @@ class SlackNotifierPlugin(NotificationPlugin):
     
     def shutdown(self) -> None:
         """Cleanup when plugin is disabled"""
+        if self._sender is not None:
+            # Notifications queued before the sentinel are still sent
+            try:
+                self._queue.put(_SENTINEL, timeout=_SHUTDOWN_TIMEOUT)
+                self._sender.join(timeout=_SHUTDOWN_TIMEOUT)
+            except queue.Full:
+                logger.warning("Slack notification queue did not drain before shutdown")
+            self._queue = None
+            self._sender = None
+        
+        if self._http is not None:
+            self._http.clear()
+            self._http = None
         logger.info("Slack Notifier plugin shutdown")
     
     def send_notification(self, message: str, level: str = "info", **options) -> bool:
-        """Send a notification to Slack"""
+        """Send a notification to Slack
+        
+        Once the plugin is initialized the notification is queued for the
+        sender thread, and the result only says whether it was queued.
+        """
         if not self.webhook_url:
             logger.warning("Cannot send notification: webhook URL not configured")
             return False
         
+        if self._queue is None:
+            return self._send_sync(message, level, **options)
+        
+        try:
+            self._queue.put_nowait((message, level, options))
+            return True
+        except queue.Full:
+            logger.warning(f"Slack notification queue is full, dropping: {message[:50]}...")
+            return False
+    
+    def _send_worker(self, notifications: queue.Queue) -> None:
+        """Send queued notifications until the sentinel arrives"""
+        while True:
+            item = notifications.get()
+            if item is _SENTINEL:
+                break
+            message, level, options = item
+            self._send_sync(message, level, **options)
+    
+    def _send_sync(self, message: str, level: str = "info", **options) -> bool:
+        """Post a notification to the Slack webhook"""
         try:
             # Determine color based on level
-            color_map = {
-                'info': '#36a64f',     # Green
-                'warning': '#ff9900',   # Orange
-                'error': '#ff0000',     # Red
-                'success': '#36a64f'    # Green
-            }
-            color = color_map.get(level, '#808080')
+            color = _LEVEL_COLORS.get(level, '#808080')
             
-            # Build payload
-            payload = {
-                'channel': options.get('channel', self.channel),
-                'username': options.get('username', self.username),
-                'icon_emoji': options.get('icon_emoji', self.icon_emoji),
-                'attachments': [
-                    {
-                        'color': color,
-                        'text': message,
-                        'fallback': message,
-                        'footer': 'DocScope',
-                        'ts': int(time.time()) if 'time' in locals() else None
-                    }
-                ]
-            }
-            
-            # Add fields if provided
-            if 'fields' in options:
-                payload['attachments'][0]['fields'] = options['fields']
+            if not options and self._payload_prefix is not None:
+                body = self._render_payload(message, color)
+            else:
+                # Build payload
+                payload = {
+                    'channel': options.get('channel', self.channel),
+                    'username': options.get('username', self.username),
+                    'icon_emoji': options.get('icon_emoji', self.icon_emoji),
+                    'attachments': [
+                        {
+                            'color': color,
+                            'text': message,
+                            'fallback': message,
+                            'footer': 'DocScope',
+                            'ts': int(time.time())
+                        }
+                    ]
+                }
+                
+                # Add fields if provided
+                if 'fields' in options:
+                    payload['attachments'][0]['fields'] = options['fields']
+                
+                body = _dumps(payload)
             
             # Send to Slack
-            req = Request(
-                self.webhook_url,
-                data=json.dumps(payload).encode('utf-8'),
-                headers={'Content-Type': 'application/json'}
-            )
             
-            response = urlopen(req)
+            if self._http is not None:
+                response = self._http.request('POST', self.webhook_url, body=body, headers=_JSON_HEADERS)
+            else:
+                req = Request(self.webhook_url, data=body, headers=_JSON_HEADERS)
+                response = urlopen(req, timeout=_HTTP_TIMEOUT)
             
             if response.status == 200:
                 logger.debug(f"Successfully sent Slack notification: {message[:50]}...")
@@ -135,6 +259,18 @@ class SlackNotifierPlugin(NotificationPlugin):
             logger.error(f"Failed to send Slack notification: {e}")
             return False
     
+    def _render_payload(self, message: str, color: str) -> bytes:
+        """Serialize a notification using the pre-serialized payload prefix"""
+        text = json.dumps(message).encode('utf-8')
+        return b''.join((
+            self._payload_prefix,
+            json.dumps(color).encode('utf-8'),
+            b',"text":', text,
+            b',"fallback":', text,
+            b',"footer":"DocScope","ts":', b'%d' % int(time.time()),
+            b'}]}'
+        ))
+    
     def notify_scan_complete(self, scan_result: Dict[str, Any]) -> None:
         """Hook handler for scan completion"""
         if not self.enabled:
@@ -1,13 +1,27 @@
 """Plugin loader for DocScope"""
 
 import os
+import shutil
+import stat
 import sys
 import json
 import importlib
 import importlib.util
+import inspect
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from types import ModuleType
+from typing import Dict, List, Optional, Set, Tuple, Type
 import logging
+from functools import lru_cache
+
+from packaging.version import Version, parse as parse_version
+
+# orjson is optional; it parses plugin.json and config.json faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base import Plugin, PluginMetadata
 from .exceptions import (
@@ -17,17 +31,97 @@ from .exceptions import (
     PluginDependencyError
 )
 from ..core.config import Config
+from .. import __version__
 
 logger = logging.getLogger(__name__)
 
+# A loadable plugin: ("package", directory) or ("file", path to the .py file)
+PluginLocation = Tuple[str, Path]
+
+# The running DocScope version never changes, so it is parsed once
+_CURRENT_VERSION = parse_version(__version__)
+
+
+@lru_cache(maxsize=128)
+def _parse_required_version(required: str) -> Version:
+    """Parse a version requirement, memoized across plugins"""
+    return parse_version(required)
+
+
+# Parsed JSON files, keyed by path and stored with (mtime_ns, size)
+_json_cache: Dict[str, Tuple[int, int, Dict]] = {}
+
+
+def _read_json_cached(path: str) -> Optional[Dict]:
+    """Read a JSON file, reusing the parsed data while the file is unchanged
+    
+    Returns None when the file does not exist. The returned dict is shared
+    between callers and must not be modified.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    _json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+# Commands already found on PATH. Misses are not cached, so a command
+# installed after a failed check is found on the next one
+_found_commands: Set[str] = set()
+
+
+def _which_cached(command: str) -> bool:
+    """Check whether a command is on PATH, remembering only hits"""
+    if command in _found_commands:
+        return True
+    if shutil.which(command) is None:
+        return False
+    _found_commands.add(command)
+    return True
+
+
+def _setting(section, key: str, default=None):
+    """Read a key from a config section that is either a dict or an object"""
+    if isinstance(section, dict):
+        return section.get(key, default)
+    return getattr(section, key, default)
+
 
 class PluginLoader:
     """Load and validate plugins"""
     
     def __init__(self, config: Config):
         self.config = config
+        # Plugin settings are resolved once; Config.plugins is a plain dict
+        # but attribute-style sections are accepted too
+        plugins_config = getattr(config, 'plugins', None) or {}
+        self._config_dirs = list(_setting(plugins_config, 'directories') or ())
+        self._plugin_configs = _setting(plugins_config, 'configs') or {}
+        self.autoload = bool(_setting(plugins_config, 'autoload', False))
         self.plugin_dirs = self._get_plugin_directories()
         self.loaded_modules = {}
+        # Plugin names found in each directory, keyed by the directory and
+        # stored with the directory mtime they were read at
+        self._discover_cache: Dict[Path, Tuple[int, Dict[str, List[PluginLocation]]]] = {}
+        # Where each discovered plugin can be loaded from, in search order
+        self._index: Dict[str, List[PluginLocation]] = {}
+        # Metadata per plugin class, and classes that passed validation
+        self._metadata_cache: Dict[Type[Plugin], PluginMetadata] = {}
+        self._validated: Set[Type[Plugin]] = set()
+        # Modules executed from plugin files, stored with the file mtime
+        self._module_cache: Dict[str, Tuple[int, ModuleType]] = {}
+        # Guards the caches above; plugins may be loaded from several
+        # threads, but modules are executed outside the lock
+        self._lock = threading.RLock()
         
     def _get_plugin_directories(self) -> List[Path]:
         """Get plugin directories from configuration"""
@@ -41,111 +135,187 @@ class PluginLoader:
         ]
         
         # Add configured directories
-        if hasattr(self.config, 'plugins') and self.config.plugins:
-            if hasattr(self.config.plugins, 'directories'):
-                for dir_path in self.config.plugins.directories:
-                    dirs.append(Path(dir_path))
+        for dir_path in self._config_dirs:
+            dirs.append(Path(os.path.expanduser(dir_path)))
         
         # Add default directories
-        for dir_path in default_dirs:
-            if dir_path not in dirs:
-                dirs.append(dir_path)
+        dirs.extend(default_dirs)
         
-        # Filter existing directories
-        existing_dirs = [d for d in dirs if d.exists() and d.is_dir()]
+        # Keep existing directories, once per canonical path so aliases and
+        # symlinks are not scanned twice; one stat checks existence and type
+        existing_dirs = []
+        seen = set()
+        for dir_path in dirs:
+            try:
+                if not stat.S_ISDIR(os.stat(dir_path).st_mode):
+                    continue
+            except OSError:
+                continue
+            
+            real_path = os.path.realpath(dir_path)
+            if real_path not in seen:
+                seen.add(real_path)
+                existing_dirs.append(dir_path)
         
         return existing_dirs
     
     def discover_plugins(self) -> List[str]:
-        """Discover available plugins"""
-        discovered = []
+        """Discover available plugins
         
-        for plugin_dir in self.plugin_dirs:
-            # Look for plugin packages (directories with __init__.py)
-            for item in plugin_dir.iterdir():
-                if item.is_dir() and (item / "__init__.py").exists():
-                    plugin_name = item.name
-                    if plugin_name not in discovered:
-                        discovered.append(plugin_name)
-                        logger.debug(f"Discovered plugin: {plugin_name} in {plugin_dir}")
+        Directory listings are cached and only read again when the
+        directory's mtime changes. Adding ``__init__.py`` to an existing
+        subdirectory does not change that mtime; call ``invalidate()``
+        after such changes.
+        """
+        # Names seen first in an earlier directory keep their position
+        index: Dict[str, List[PluginLocation]] = {}
+        
+        with self._lock:
+            for plugin_dir in self.plugin_dirs:
+                try:
+                    mtime = os.stat(plugin_dir).st_mtime_ns
+                except OSError:
+                    continue
+                
+                cached = self._discover_cache.get(plugin_dir)
+                if cached is not None and cached[0] == mtime:
+                    found = cached[1]
+                else:
+                    found = self._scan_plugin_directory(plugin_dir)
+                    self._discover_cache[plugin_dir] = (mtime, found)
+                
+                for name, locations in found.items():
+                    index.setdefault(name, []).extend(locations)
+            
+            self._index = index
+        return list(index)
+    
+    def _scan_plugin_directory(self, plugin_dir: Path) -> Dict[str, List[PluginLocation]]:
+        """List the plugins in a single directory
+        
+        Entry types come from the directory listing itself, so only package
+        candidates cost an extra stat for their ``__init__.py``. A package
+        is listed before a single-file plugin of the same name.
+        """
+        discovered: Dict[str, List[PluginLocation]] = {}
+        
+        with os.scandir(plugin_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                
+                # Look for plugin packages (directories with __init__.py)
+                if entry.is_dir():
+                    if not os.path.exists(os.path.join(entry.path, "__init__.py")):
+                        continue
+                    plugin_name = name
+                    location = ("package", Path(entry.path))
                 
                 # Also look for single-file plugins
-                elif item.is_file() and item.suffix == ".py" and item.stem != "__init__":
-                    plugin_name = item.stem
-                    if plugin_name not in discovered:
-                        discovered.append(plugin_name)
-                        logger.debug(f"Discovered plugin: {plugin_name} in {plugin_dir}")
+                elif entry.is_file() and name.endswith(".py") and len(name) > 3:
+                    plugin_name = name[:-3]
+                    if plugin_name == "__init__":
+                        continue
+                    location = ("file", Path(entry.path))
+                
+                else:
+                    continue
+                
+                locations = discovered.get(plugin_name)
+                if locations is None:
+                    discovered[plugin_name] = [location]
+                    logger.debug(f"Discovered plugin: {plugin_name} in {plugin_dir}")
+                elif location[0] == "package":
+                    locations.insert(0, location)
+                else:
+                    locations.append(location)
         
         return discovered
     
+    def invalidate(self) -> None:
+        """Forget cached plugin directory listings, locations and commands"""
+        with self._lock:
+            self._discover_cache.clear()
+            self._index = {}
+            _found_commands.clear()
+    
     def load_plugin(self, name: str) -> Type[Plugin]:
-        """Load a plugin class by name"""
-        if name in self.loaded_modules:
-            return self.loaded_modules[name]
+        """Load a plugin class by name
+        
+        Safe to call from several threads; if two threads load the same
+        plugin, the class found first is kept.
+        """
+        with self._lock:
+            if name in self.loaded_modules:
+                return self.loaded_modules[name]
+            
+            if name not in self._index:
+                self.discover_plugins()
+            locations = list(self._index.get(name, ()))
         
         plugin_class = None
         
-        # Try to load from each plugin directory
-        for plugin_dir in self.plugin_dirs:
-            # Try package format
-            package_path = plugin_dir / name
-            if package_path.is_dir() and (package_path / "__init__.py").exists():
+        # Try each location the plugin was discovered at
+        for kind, path in locations:
+            if kind == "package":
                 try:
-                    plugin_class = self._load_package_plugin(name, package_path)
+                    plugin_class = self._load_package_plugin(name, path)
                     if plugin_class:
                         break
                 except Exception as e:
-                    logger.warning(f"Failed to load plugin package {name} from {package_path}: {e}")
-            
-            # Try single file format
-            file_path = plugin_dir / f"{name}.py"
-            if file_path.is_file():
+                    logger.warning(f"Failed to load plugin package {name} from {path}: {e}")
+            else:
                 try:
-                    plugin_class = self._load_file_plugin(name, file_path)
+                    plugin_class = self._load_file_plugin(name, path)
                     if plugin_class:
                         break
                 except Exception as e:
-                    logger.warning(f"Failed to load plugin file {name} from {file_path}: {e}")
+                    logger.warning(f"Failed to load plugin file {name} from {path}: {e}")
         
         if not plugin_class:
             raise PluginLoadError(f"Plugin '{name}' not found in any plugin directory")
         
-        # Validate plugin class
-        if not issubclass(plugin_class, Plugin):
-            raise PluginLoadError(f"Plugin '{name}' does not inherit from Plugin base class")
-        
-        self.loaded_modules[name] = plugin_class
-        return plugin_class
+        # _find_plugin_class only returns Plugin subclasses
+        with self._lock:
+            return self.loaded_modules.setdefault(name, plugin_class)
     
     def _load_package_plugin(self, name: str, path: Path) -> Optional[Type[Plugin]]:
         """Load a plugin from a package"""
         # Check for plugin.json metadata
-        metadata_file = path / "plugin.json"
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                metadata = json.load(f)
-                logger.debug(f"Loaded metadata for plugin {name}: {metadata}")
+        metadata = _read_json_cached(os.path.join(path, "plugin.json"))
+        if metadata is not None:
+            logger.debug(f"Loaded metadata for plugin {name}: {metadata}")
         
-        # Add plugin directory to path temporarily
-        sys.path.insert(0, str(path.parent))
+        # Import the package from its __init__.py without touching sys.path,
+        # which would throw away the import system's path finder caches
+        module = self._import_from_file(
+            name, path / "__init__.py",
+            submodule_search_locations=[str(path)]
+        )
         
-        try:
-            # Import the module
-            module = importlib.import_module(name)
-            
-            # Find the Plugin subclass
-            plugin_class = self._find_plugin_class(module)
-            
-            return plugin_class
-            
-        finally:
-            # Remove from path
-            sys.path.remove(str(path.parent))
+        # Find the Plugin subclass
+        plugin_class = self._find_plugin_class(module)
+        
+        return plugin_class
     
     def _load_file_plugin(self, name: str, path: Path) -> Optional[Type[Plugin]]:
         """Load a plugin from a single file"""
         # Load the module from file
-        spec = importlib.util.spec_from_file_location(name, path)
+        module = self._import_from_file(name, path)
+        
+        # Find the Plugin subclass
+        plugin_class = self._find_plugin_class(module)
+        
+        return plugin_class
+    
+    def _import_from_file(self, name: str, path: Path, **spec_options) -> ModuleType:
+        """Import a module from a file, reusing it while the file is unchanged"""
+        mtime = path.stat().st_mtime_ns
+        with self._lock:
+            cached = self._module_cache.get(str(path))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        spec = importlib.util.spec_from_file_location(name, path, **spec_options)
         if not spec or not spec.loader:
             raise PluginLoadError(f"Cannot load plugin spec from {path}")
         
@@ -153,65 +323,84 @@ class PluginLoader:
         sys.modules[name] = module
         spec.loader.exec_module(module)
         
-        # Find the Plugin subclass
-        plugin_class = self._find_plugin_class(module)
-        
-        return plugin_class
+        with self._lock:
+            self._module_cache[str(path)] = (mtime, module)
+        return module
     
     def _find_plugin_class(self, module) -> Optional[Type[Plugin]]:
-        """Find the Plugin subclass in a module"""
-        from .base import Plugin
+        """Find the Plugin subclass in a module
+        
+        A module can name its plugin with ``__plugin_class__``. Otherwise
+        classes defined in the module win over imported ones, so base
+        classes such as NotificationPlugin are never picked by accident.
+        """
+        plugin_class = getattr(module, '__plugin_class__', None)
+        if plugin_class is not None:
+            # The only class not found by the scan below, so check it here
+            if not (isinstance(plugin_class, type) and issubclass(plugin_class, Plugin)):
+                raise PluginLoadError(
+                    f"__plugin_class__ of {module.__name__} does not inherit from Plugin base class"
+                )
+            return plugin_class
         
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
+        imported = None
+        for attr in module.__dict__.values():
             if (isinstance(attr, type) and 
                 issubclass(attr, Plugin) and 
-                attr != Plugin and
+                attr is not Plugin and
                 not attr.__name__.startswith('_')):
-                return attr
+                if attr.__module__ == module.__name__:
+                    return attr
+                # Packages may re-export a plugin defined in a submodule
+                if imported is None and not inspect.isabstract(attr):
+                    imported = attr
         
-        return None
+        return imported
     
     def load_plugin_config(self, name: str) -> Dict:
         """Load configuration for a plugin"""
         config = {}
         
-        # Check for plugin-specific config file
+        # Check for plugin-specific config file; plain string joins keep
+        # this loop free of Path objects
         for plugin_dir in self.plugin_dirs:
-            config_file = plugin_dir / name / "config.json"
-            if config_file.exists():
-                with open(config_file) as f:
-                    config.update(json.load(f))
+            file_config = _read_json_cached(os.path.join(plugin_dir, name, "config.json"))
+            if file_config is not None:
+                config.update(file_config)
                 break
         
         # Override with user configuration
-        if hasattr(self.config, 'plugins') and self.config.plugins:
-            if hasattr(self.config.plugins, 'configs'):
-                plugin_configs = self.config.plugins.configs
-                if name in plugin_configs:
-                    config.update(plugin_configs[name])
+        if name in self._plugin_configs:
+            config.update(self._plugin_configs[name])
         
         return config
     
+    def get_metadata(self, plugin_class: Type[Plugin]) -> PluginMetadata:
+        """Get plugin metadata, creating a temporary instance only once per class"""
+        metadata = self._metadata_cache.get(plugin_class)
+        if metadata is None:
+            metadata = plugin_class({}).get_metadata()
+            self._metadata_cache[plugin_class] = metadata
+        return metadata
+    
     def validate_plugin(self, plugin_class: Type[Plugin]) -> bool:
         """Validate a plugin before instantiation"""
+        if plugin_class in self._validated:
+            return True
+        
         try:
-            # Create temporary instance to get metadata
-            temp_instance = plugin_class({})
-            metadata = temp_instance.get_metadata()
+            metadata = self.get_metadata(plugin_class)
             
             # Check version compatibility
             if metadata.min_docscope_version:
-                from .. import __version__
-                if not self._check_version(__version__, metadata.min_docscope_version, '>='):
+                if not self._check_version(_CURRENT_VERSION, metadata.min_docscope_version, '>='):
                     raise PluginVersionError(
                         f"Plugin requires DocScope >= {metadata.min_docscope_version}, "
                         f"current version is {__version__}"
                     )
             
             if metadata.max_docscope_version:
-                from .. import __version__
-                if not self._check_version(__version__, metadata.max_docscope_version, '<='):
+                if not self._check_version(_CURRENT_VERSION, metadata.max_docscope_version, '<='):
                     raise PluginVersionError(
                         f"Plugin requires DocScope <= {metadata.max_docscope_version}, "
                         f"current version is {__version__}"
@@ -222,18 +411,22 @@ class PluginLoader:
                 if not self._check_dependency(dep):
                     raise PluginDependencyError(f"Plugin dependency not satisfied: {dep}")
             
+            # Failures are not remembered, so a missing dependency can be
+            # installed without restarting
+            self._validated.add(plugin_class)
             return True
             
         except Exception as e:
             logger.error(f"Plugin validation failed: {e}")
             return False
     
-    def _check_version(self, current: str, required: str, operator: str) -> bool:
-        """Check version compatibility"""
-        from packaging import version
+    def _check_version(self, current, required: str, operator: str) -> bool:
+        """Check version compatibility
         
-        current_v = version.parse(current)
-        required_v = version.parse(required)
+        ``current`` may be a version string or an already parsed Version.
+        """
+        current_v = current if isinstance(current, Version) else parse_version(current)
+        required_v = _parse_required_version(required)
         
         if operator == '>=':
             return current_v >= required_v
@@ -258,13 +451,16 @@ class PluginLoader:
         # Check other plugins
         elif dependency.startswith('plugin:'):
             plugin_name = dependency[7:]
-            return plugin_name in self.discover_plugins()
+            with self._lock:
+                if plugin_name not in self._index:
+                    # Only a miss rescans, and unchanged directories are cached
+                    self.discover_plugins()
+                return plugin_name in self._index
         
         # Check system commands
         elif dependency.startswith('cmd:'):
             command = dependency[4:]
-            import shutil
-            return shutil.which(command) is not None
+            return _which_cached(command)
         
         return True
     
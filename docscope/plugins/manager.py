@@ -1,10 +1,14 @@
 """Plugin manager for DocScope"""
 
 import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 
 from .base import Plugin, PluginCapability, PluginHook
 from .loader import PluginLoader
@@ -17,14 +21,25 @@ from .exceptions import (
 )
 from ..core.config import Config
 
+# orjson is optional; it reads and writes the plugin state file faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Threads used to import autoloaded plugin modules
+_MAX_AUTOLOAD_WORKERS = 8
+
 
 class PluginManager:
     """Manage plugin lifecycle and coordination"""
     
     _instance = None
-    _lock = threading.Lock()
+    _initialized = False
+    # Re-entrant so plugins autoloaded during __init__ can reach the manager
+    _lock = threading.RLock()
     
     def __new__(cls, config: Config = None):
         """Singleton pattern for plugin manager"""
@@ -36,16 +51,27 @@ class PluginManager:
     
     def __init__(self, config: Config = None):
         """Initialize plugin manager"""
-        if hasattr(self, '_initialized'):
+        # Checked before taking the lock, so later calls cost one lookup
+        if self._initialized:
             return
         
-        self.config = config or Config()
-        self.loader = PluginLoader(self.config)
-        self.registry = PluginRegistry()
-        self.initialized_plugins = set()
-        self._plugin_state_file = Path.home() / ".docscope" / "plugin_state.json"
-        self._load_state()
-        self._initialized = True
+        with self._lock:
+            if self._initialized:
+                return
+            
+            self.config = config or Config()
+            self.loader = PluginLoader(self.config)
+            self.registry = PluginRegistry()
+            self.initialized_plugins = set()
+            self._plugin_state_file = Path.home() / ".docscope" / "plugin_state.json"
+            # State is written after each change, or once at the end of a
+            # _batch_state_writes() block
+            self._state_dirty = False
+            self._state_batch_depth = 0
+            # Set before autoloading so plugins calling get_plugin_manager()
+            # get this instance instead of initializing it again
+            self._initialized = True
+            self._load_state()
     
     def discover(self) -> List[str]:
         """Discover available plugins"""
@@ -111,25 +137,27 @@ class PluginManager:
     
     def reload_plugin(self, name: str) -> Plugin:
         """Reload a plugin"""
-        # Unload if loaded
-        if name in self.initialized_plugins:
-            self.unload_plugin(name)
-        
-        # Load again
-        return self.load_plugin(name)
+        with self._batch_state_writes():
+            # Unload if loaded
+            if name in self.initialized_plugins:
+                self.unload_plugin(name)
+            
+            # Load again
+            return self.load_plugin(name)
     
     def enable_plugin(self, name: str) -> bool:
         """Enable a plugin"""
         try:
-            # Load if not loaded
-            if name not in self.initialized_plugins:
-                self.load_plugin(name)
-            
-            # Enable
-            self.registry.enable_plugin(name)
-            
-            # Save state
-            self._save_state()
+            with self._batch_state_writes():
+                # Load if not loaded
+                if name not in self.initialized_plugins:
+                    self.load_plugin(name)
+                
+                # Enable
+                self.registry.enable_plugin(name)
+                
+                # Save state
+                self._save_state()
             
             return True
             
@@ -196,6 +224,18 @@ class PluginManager:
         if name not in self.discover():
             raise PluginNotFoundError(f"Plugin '{name}' not found")
         
+        return self._plugin_details(name)
+    
+    def list_plugins_detailed(self) -> List[Dict[str, Any]]:
+        """Get detailed information about all discovered plugins
+        
+        Same entries as get_plugin_info(), but plugins are discovered once
+        and each class and its metadata come from the loader's caches.
+        """
+        return [self._plugin_details(name) for name in self.discover()]
+    
+    def _plugin_details(self, name: str) -> Dict[str, Any]:
+        """Build the detailed information for a discovered plugin"""
         info = {
             'name': name,
             'available': True,
@@ -205,8 +245,7 @@ class PluginManager:
         # Try to get metadata without loading
         try:
             plugin_class = self.loader.load_plugin(name)
-            temp_instance = plugin_class({})
-            metadata = temp_instance.get_metadata()
+            metadata = self.loader.get_metadata(plugin_class)
             
             info.update({
                 'version': metadata.version,
@@ -252,6 +291,7 @@ class PluginManager:
         
         # Remove plugin files (placeholder)
         # This would remove the plugin directory
+        self.loader.invalidate()
         
         return True
     
@@ -268,19 +308,16 @@ class PluginManager:
         """Search for plugins in repository (placeholder)"""
         # This would search a plugin repository
         # For now, return local plugins matching query
-        results = []
+        query = query.lower()
         
-        for plugin_info in self.list_plugins():
-            name = plugin_info['name']
-            description = plugin_info.get('description', '')
-            
-            if query.lower() in name.lower() or query.lower() in description.lower():
-                results.append(plugin_info)
-                
-                if len(results) >= limit:
-                    break
+        # Descriptions are None for plugins that are not loaded
+        matches = (
+            plugin_info for plugin_info in self.list_plugins()
+            if query in plugin_info['name'].lower()
+            or query in (plugin_info.get('description') or '').lower()
+        )
         
-        return results
+        return list(islice(matches, limit))
     
     def execute_hook(self, hook: PluginHook, *args, **kwargs) -> List[Any]:
         """Execute a hook through the registry"""
@@ -304,45 +341,117 @@ class PluginManager:
     
     def _load_state(self) -> None:
         """Load plugin state from file"""
-        if not self._plugin_state_file.exists():
-            return
-        
         try:
-            with open(self._plugin_state_file) as f:
-                state = json.load(f)
+            with open(self._plugin_state_file, 'rb') as f:
+                raw = f.read()
+            state = orjson.loads(raw) if orjson else json.loads(raw)
             
             # Auto-load previously enabled plugins
-            if self.config.plugins and hasattr(self.config.plugins, 'autoload'):
-                if self.config.plugins.autoload:
-                    for plugin_name in state.get('enabled', []):
+            if self.loader.autoload:
+                enabled = state.get('enabled', [])
+                self._preload_plugin_classes(enabled)
+                with self._batch_state_writes():
+                    for plugin_name in enabled:
                         try:
                             self.load_plugin(plugin_name)
                             logger.info(f"Auto-loaded plugin: {plugin_name}")
                         except Exception as e:
                             logger.warning(f"Failed to auto-load plugin '{plugin_name}': {e}")
             
+        except FileNotFoundError:
+            # No state saved yet
+            return
         except Exception as e:
             logger.warning(f"Failed to load plugin state: {e}")
     
+    def _preload_plugin_classes(self, names: List[str]) -> None:
+        """Import plugin modules on a thread pool ahead of loading them
+        
+        Imports are independent and mostly file I/O, so they overlap well.
+        Instances are still created, initialized and registered one by one
+        in state order. Import failures are logged here and raised again
+        when load_plugin retries. If no pool can be started, the modules
+        are imported sequentially.
+        """
+        if len(names) < 2:
+            return
+        
+        # Build the discovery index before threads start looking names up
+        self.loader.discover_plugins()
+        
+        workers = min(_MAX_AUTOLOAD_WORKERS, len(names))
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docscope-plugins") as executor:
+                futures = {executor.submit(self.loader.load_plugin, name): name for name in names}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to import plugin '{futures[future]}': {e}")
+        except RuntimeError as e:
+            logger.debug(f"Importing plugins sequentially: {e}")
+            for name in names:
+                try:
+                    self.loader.load_plugin(name)
+                except Exception as e:
+                    logger.warning(f"Failed to import plugin '{name}': {e}")
+    
+    @contextmanager
+    def _batch_state_writes(self):
+        """Write plugin state once for every change made inside the block
+        
+        Blocks may nest; the state is written when the outermost one exits.
+        """
+        self._state_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._state_batch_depth -= 1
+            if not self._state_batch_depth:
+                self._flush_state()
+    
     def _save_state(self) -> None:
-        """Save plugin state to file"""
+        """Record a plugin state change and write it to file
+        
+        Inside _batch_state_writes() the write is deferred until the
+        outermost block exits, so autoloading or enabling several plugins
+        costs a single write.
+        """
+        self._state_dirty = True
+        if not self._state_batch_depth:
+            self._flush_state()
+    
+    def _flush_state(self) -> None:
+        """Write plugin state to file if it changed"""
+        if not self._state_dirty:
+            return
+        
         try:
             # Create directory if needed
             self._plugin_state_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Get enabled plugins
-            enabled = [
-                name for name in self.initialized_plugins
-                if self.registry.get_plugin(name).enabled
-            ]
+            enabled = list(self.registry.iter_enabled_names())
             
+            # Plugins may finish loading in any order; sort them so the
+            # file does not change between runs with the same plugins
             state = {
                 'enabled': enabled,
-                'loaded': list(self.initialized_plugins)
+                'loaded': sorted(self.initialized_plugins)
             }
             
-            with open(self._plugin_state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Write to a temporary file and rename it over the old state, so
+            # a crash mid-write never leaves a truncated file behind
+            if orjson:
+                data = orjson.dumps(state)
+            else:
+                data = json.dumps(state, separators=(',', ':')).encode()
+            
+            tmp_file = self._plugin_state_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self._plugin_state_file)
+            self._state_dirty = False
             
         except Exception as e:
             logger.warning(f"Failed to save plugin state: {e}")
@@ -1,6 +1,7 @@
 """Plugin registry for managing loaded plugins"""
 
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, Iterator, List, Optional, Callable, Any, Tuple
+import asyncio
 import logging
 
 from .base import Plugin, PluginHook, PluginCapability
@@ -8,15 +9,22 @@ from .exceptions import PluginNotFoundError, PluginExecutionError
 
 logger = logging.getLogger(__name__)
 
+# Placeholder for coroutine handler results not gathered yet
+_PENDING = object()
+
 
 class PluginRegistry:
     """Central registry for loaded plugins"""
     
     def __init__(self):
         self.plugins: Dict[str, Plugin] = {}
-        self.hooks: Dict[PluginHook, List[Callable]] = {}
+        # Handlers are stored as tuples and replaced on change, so running a
+        # hook never iterates a sequence that is being modified
+        self.hooks: Dict[PluginHook, Tuple[Callable, ...]] = {}
         self.capabilities: Dict[PluginCapability, List[str]] = {}
         self.commands: Dict[str, Dict[str, Any]] = {}
+        # Bare command name -> fully qualified "plugin:command" names
+        self._bare_commands: Dict[str, List[str]] = {}
         self.api_routes: List[Dict[str, Any]] = []
         
     def register(self, plugin: Plugin) -> None:
@@ -31,9 +39,7 @@ class PluginRegistry:
         
         # Register hooks
         for hook, handlers in plugin.get_hooks().items():
-            if hook not in self.hooks:
-                self.hooks[hook] = []
-            self.hooks[hook].extend(handlers)
+            self.hooks[hook] = self.hooks.get(hook, ()) + tuple(handlers)
             logger.debug(f"Registered {len(handlers)} handlers for hook {hook} from plugin {name}")
         
         # Register capabilities
@@ -51,6 +57,9 @@ class PluginRegistry:
                 'handler': cmd_info['handler'],
                 'description': cmd_info['description']
             }
+            qualified = self._bare_commands.setdefault(cmd_name, [])
+            if full_name not in qualified:
+                qualified.append(full_name)
             logger.debug(f"Registered command {full_name}")
         
         # Register API routes
@@ -72,9 +81,11 @@ class PluginRegistry:
         # Remove hooks
         for hook, handlers in plugin.get_hooks().items():
             if hook in self.hooks:
+                remaining = list(self.hooks[hook])
                 for handler in handlers:
-                    if handler in self.hooks[hook]:
-                        self.hooks[hook].remove(handler)
+                    if handler in remaining:
+                        remaining.remove(handler)
+                self.hooks[hook] = tuple(remaining)
         
         # Remove capabilities
         for capability in metadata.capabilities:
@@ -89,6 +100,12 @@ class PluginRegistry:
         ]
         for cmd in commands_to_remove:
             del self.commands[cmd]
+            cmd_name = cmd[len(name) + 1:]
+            qualified = self._bare_commands.get(cmd_name)
+            if qualified is not None:
+                qualified.remove(cmd)
+                if not qualified:
+                    del self._bare_commands[cmd_name]
         
         # Remove API routes
         self.api_routes = [
@@ -111,6 +128,10 @@ class PluginRegistry:
         """List all registered plugin names"""
         return list(self.plugins.keys())
     
+    def iter_enabled_names(self) -> Iterator[str]:
+        """Iterate over the names of enabled plugins"""
+        return (name for name, plugin in self.plugins.items() if plugin.enabled)
+    
     def get_plugins_by_capability(self, capability: PluginCapability) -> List[Plugin]:
         """Get all plugins with a specific capability"""
         plugin_names = self.capabilities.get(capability, [])
@@ -119,7 +140,7 @@ class PluginRegistry:
     def execute_hook(self, hook: PluginHook, *args, **kwargs) -> List[Any]:
         """Execute all handlers for a hook"""
         results = []
-        handlers = self.hooks.get(hook, [])
+        handlers = self.hooks.get(hook, ())
         
         for handler in handlers:
             try:
@@ -133,33 +154,46 @@ class PluginRegistry:
         return results
     
     async def execute_hook_async(self, hook: PluginHook, *args, **kwargs) -> List[Any]:
-        """Execute all handlers for a hook asynchronously"""
-        import asyncio
-        results = []
-        handlers = self.hooks.get(hook, [])
+        """Execute all handlers for a hook asynchronously
+        
+        Coroutine handlers run concurrently; plain handlers run first, in
+        order. Results keep the order of the handlers that succeeded.
+        """
+        slots = []
+        coros = []
+        handlers = self.hooks.get(hook, ())
         
         for handler in handlers:
             try:
                 if asyncio.iscoroutinefunction(handler):
-                    result = await handler(*args, **kwargs)
+                    coros.append(handler(*args, **kwargs))
+                    slots.append(_PENDING)
                 else:
-                    result = handler(*args, **kwargs)
-                results.append(result)
-                logger.debug(f"Executed async hook {hook} handler successfully")
+                    slots.append(handler(*args, **kwargs))
+                    logger.debug(f"Executed async hook {hook} handler successfully")
             except Exception as e:
                 logger.error(f"Error executing async hook {hook}: {e}")
                 # Continue with other handlers
         
+        gathered = iter(await asyncio.gather(*coros, return_exceptions=True))
+        
+        results = []
+        for result in slots:
+            if result is _PENDING:
+                result = next(gathered)
+                if isinstance(result, Exception):
+                    logger.error(f"Error executing async hook {hook}: {result}")
+                    continue
+                logger.debug(f"Executed async hook {hook} handler successfully")
+            results.append(result)
+        
         return results
     
     def execute_command(self, command: str, *args, **kwargs) -> Any:
         """Execute a plugin command"""
         if command not in self.commands:
             # Try without plugin prefix
-            matching_commands = [
-                cmd for cmd in self.commands 
-                if cmd.split(':')[-1] == command
-            ]
+            matching_commands = self._bare_commands.get(command, [])
             if len(matching_commands) == 1:
                 command = matching_commands[0]
             elif len(matching_commands) > 1:
@@ -11,6 +11,24 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Characters encoded at a time when hashing document content
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _content_hash(content: str) -> str:
+    """SHA-256 of the UTF-8 encoded content
+    
+    Encoding in chunks gives the same digest as hashing content.encode(),
+    without holding a second full copy of large documents in memory.
+    """
+    if len(content) <= _HASH_CHUNK_SIZE:
+        return hashlib.sha256(content.encode()).hexdigest()
+    
+    digest = hashlib.sha256()
+    for start in range(0, len(content), _HASH_CHUNK_SIZE):
+        digest.update(content[start:start + _HASH_CHUNK_SIZE].encode())
+    return digest.hexdigest()
+
 
 class FormatHandler(ABC):
     """Abstract base class for format handlers"""
@@ -18,25 +36,46 @@ class FormatHandler(ABC):
     format_type: DocumentFormat
     extensions: List[str] = []
     mime_types: List[str] = []
+    # How undecodable bytes are treated when reading files as UTF-8
+    encoding_errors: str = 'strict'
     
-    @abstractmethod
     def can_handle(self, path: Path) -> bool:
         """Check if this handler can process the file
         
+        The default matches the file extension against ``extensions``.
+        Handlers that inspect anything else override this method.
+        
         Args:
             path: Path to the file
             
         Returns:
             True if handler can process this file
         """
-        pass
+        return path.suffix.lower() in self.extensions
+    
+    def read_text(self, path: Path) -> str:
+        """Read the raw text of a file
+        
+        Args:
+            path: Path to the file
+            
+        Returns:
+            File text decoded as UTF-8, with newlines normalized to '\\n'
+        """
+        # Reading bytes and decoding once skips the TextIOWrapper layer;
+        # newline translation is done here to match text-mode reads
+        text = Path(path).read_bytes().decode('utf-8', errors=self.encoding_errors)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
     
     @abstractmethod
-    def extract_content(self, path: Path) -> str:
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
         """Extract text content from the file
         
         Args:
             path: Path to the file
+            text: Raw file text, if already read; read from path otherwise
             
         Returns:
             Extracted text content
@@ -44,23 +83,25 @@ class FormatHandler(ABC):
         pass
     
     @abstractmethod
-    def extract_metadata(self, path: Path) -> Dict:
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
         """Extract metadata from the file
         
         Args:
             path: Path to the file
+            text: Raw file text, if already read; read from path otherwise
             
         Returns:
             Dictionary of metadata
         """
         pass
     
-    def extract_title(self, path: Path, content: str) -> str:
+    def extract_title(self, path: Path, content: str, text: Optional[str] = None) -> str:
         """Extract or generate a title for the document
         
         Args:
             path: Path to the file
             content: Document content
+            text: Raw file text, if already read
             
         Returns:
             Document title
@@ -78,20 +119,23 @@ class FormatHandler(ABC):
             Document object
         """
         try:
+            # Read the file once and share the text between extractors
+            text = self.read_text(path)
+            
             # Extract content
-            content = self.extract_content(path)
+            content = self.extract_content(path, text)
             
             # Extract metadata
-            metadata = self.extract_metadata(path)
+            metadata = self.extract_metadata(path, text)
             
             # Extract or generate title
-            title = self.extract_title(path, content)
+            title = self.extract_title(path, content, text)
             
             # Get file stats
             stat = path.stat()
             
             # Calculate content hash
-            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            content_hash = _content_hash(content)
             
             # Create document
             doc = Document(
@@ -121,6 +165,9 @@ class FormatRegistry:
     def __init__(self):
         self._handlers: Dict[str, FormatHandler] = {}
         self._extension_map: Dict[str, str] = {}
+        # Handlers with their own can_handle; extension-only handlers are
+        # fully covered by _extension_map
+        self._custom_handlers: Dict[str, FormatHandler] = {}
         
     def register(self, handler: FormatHandler) -> None:
         """Register a format handler
@@ -131,6 +178,11 @@ class FormatRegistry:
         handler_name = handler.__class__.__name__
         self._handlers[handler_name] = handler
         
+        if type(handler).can_handle is FormatHandler.can_handle:
+            self._custom_handlers.pop(handler_name, None)
+        else:
+            self._custom_handlers[handler_name] = handler
+        
         # Map extensions to handler
         for ext in handler.extensions:
             self._extension_map[ext.lower()] = handler_name
@@ -152,8 +204,8 @@ class FormatRegistry:
             handler_name = self._extension_map[ext]
             return self._handlers[handler_name]
         
-        # Try each handler's can_handle method
-        for handler in self._handlers.values():
+        # Try handlers that decide by more than the extension
+        for handler in self._custom_handlers.values():
             if handler.can_handle(path):
                 return handler
         
@@ -4,9 +4,32 @@ import json
 import yaml
 import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 import ast
+import threading
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# lxml parses HTML much faster than the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Use the libyaml C bindings when PyYAML was built with them
+_YAMLLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAMLDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# orjson is optional; it parses and pretty-prints JSON documents faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .format_handler import FormatHandler
 from ..core.models import DocumentFormat
@@ -14,26 +37,43 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns used on every scanned file, compiled once
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+# Images and links; images come first so their [alt](url) part is not
+# also reported as a link
+_INLINE_PATTERN = (
+    r'(?P<image>!\[(?P<alt>[^\]]*)\]\((?P<image_url>[^)]+)\))'
+    r'|(?P<link>\[(?P<text>[^\]]+)\]\((?P<link_url>[^)]+)\))'
+)
+_INLINE_RE = re.compile(_INLINE_PATTERN)
+# Headers, images and links in a single pass over the document
+_MARKDOWN_RE = re.compile(
+    r'(?P<header>^(?P<level>#{1,6})\s+(?P<title>.+)$)|' + _INLINE_PATTERN,
+    re.MULTILINE
+)
+_FRONTMATTER_END_RE = re.compile(r'\n---\n')
+_DOCSTRING_DQ_RE = re.compile(r'^\s*"""(.*?)"""', re.DOTALL)
+_DOCSTRING_SQ_RE = re.compile(r"^\s*'''(.*?)'''", re.DOTALL)
+
 
 class TextHandler(FormatHandler):
     """Handler for plain text files"""
     
     format_type = DocumentFormat.TEXT
     extensions = ['.txt', '.text', '.log', '.csv', '.tsv']
+    encoding_errors = 'ignore'
     
-    def can_handle(self, path: Path) -> bool:
-        return path.suffix.lower() in self.extensions
-    
-    def extract_content(self, path: Path) -> str:
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
+        if text is not None:
+            return text
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
+            return self.read_text(path)
         except Exception as e:
             logger.error(f"Error reading text file {path}: {e}")
             raise
     
-    def extract_metadata(self, path: Path) -> Dict:
-        content = self.extract_content(path)
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
+        content = self.extract_content(path, text)
         lines = content.splitlines()
         return {
             'line_count': len(lines),
@@ -49,24 +89,23 @@ class MarkdownHandler(FormatHandler):
     format_type = DocumentFormat.MARKDOWN
     extensions = ['.md', '.markdown', '.mkd', '.mdx']
     
-    def can_handle(self, path: Path) -> bool:
-        return path.suffix.lower() in self.extensions
-    
-    def extract_content(self, path: Path) -> str:
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
+        if text is not None:
+            return text
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return self.read_text(path)
         except Exception as e:
             logger.error(f"Error reading markdown file {path}: {e}")
             raise
     
-    def extract_metadata(self, path: Path) -> Dict:
-        content = self.extract_content(path)
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
+        content = self.extract_content(path, text)
+        headers, links, images = self._extract_elements(content)
         metadata = {
             'format': 'markdown',
-            'headers': self._extract_headers(content),
-            'links': self._extract_links(content),
-            'images': self._extract_images(content),
+            'headers': headers,
+            'links': links,
+            'images': images,
         }
         
         # Check for frontmatter
@@ -76,9 +115,9 @@ class MarkdownHandler(FormatHandler):
             
         return metadata
     
-    def extract_title(self, path: Path, content: str) -> str:
+    def extract_title(self, path: Path, content: str, text: Optional[str] = None) -> str:
         # Try to find H1 header
-        h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        h1_match = _H1_RE.search(content)
         if h1_match:
             return h1_match.group(1).strip()
         
@@ -90,39 +129,41 @@ class MarkdownHandler(FormatHandler):
         # Fallback to filename
         return super().extract_title(path, content)
     
-    def _extract_headers(self, content: str) -> list:
-        """Extract all headers from markdown"""
+    def _extract_elements(self, content: str) -> Tuple[list, list, list]:
+        """Extract all headers, links and images from markdown in one pass"""
         headers = []
-        for match in re.finditer(r'^(#{1,6})\s+(.+)$', content, re.MULTILINE):
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            headers.append({'level': level, 'text': text})
-        return headers
-    
-    def _extract_links(self, content: str) -> list:
-        """Extract all links from markdown"""
         links = []
-        # [text](url) format
-        for match in re.finditer(r'\[([^\]]+)\]\(([^)]+)\)', content):
-            links.append({'text': match.group(1), 'url': match.group(2)})
-        return links
-    
-    def _extract_images(self, content: str) -> list:
-        """Extract all images from markdown"""
         images = []
-        # ![alt](url) format
-        for match in re.finditer(r'!\[([^\]]*)\]\(([^)]+)\)', content):
-            images.append({'alt': match.group(1), 'url': match.group(2)})
-        return images
+        
+        def add_inline(match):
+            if match.lastgroup == 'image':
+                # ![alt](url) format
+                images.append({'alt': match.group('alt'), 'url': match.group('image_url')})
+            else:
+                # [text](url) format
+                links.append({'text': match.group('text'), 'url': match.group('link_url')})
+        
+        for match in _MARKDOWN_RE.finditer(content):
+            if match.lastgroup == 'header':
+                title = match.group('title')
+                headers.append({'level': len(match.group('level')), 'text': title.strip()})
+                # A header line can itself contain links and images
+                if '[' in title:
+                    for inline in _INLINE_RE.finditer(title):
+                        add_inline(inline)
+            else:
+                add_inline(match)
+        
+        return headers, links, images
     
     def _extract_frontmatter(self, content: str) -> Optional[Dict]:
         """Extract YAML frontmatter if present"""
         if content.startswith('---'):
             try:
-                end_match = re.search(r'\n---\n', content[3:])
+                end_match = _FRONTMATTER_END_RE.search(content[3:])
                 if end_match:
                     frontmatter_text = content[3:end_match.start() + 3]
-                    return yaml.safe_load(frontmatter_text)
+                    return yaml.load(frontmatter_text, Loader=_YAMLLoader)
             except:
                 pass
         return None
@@ -134,26 +175,63 @@ class JSONHandler(FormatHandler):
     format_type = DocumentFormat.JSON
     extensions = ['.json', '.jsonl', '.geojson']
     
-    def can_handle(self, path: Path) -> bool:
-        return path.suffix.lower() in self.extensions
+    def __init__(self):
+        # Last parsed document per scanner thread, see _parse()
+        self._local = threading.local()
+    
+    def _parse(self, text: str):
+        """Parse JSON, reusing the result when given the same text again
+        
+        Content and metadata are extracted from one text object, so each
+        file is parsed once instead of twice.
+        """
+        cached = getattr(self._local, 'data', None)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        
+        if orjson is None:
+            data = json.loads(text)
+        else:
+            try:
+                data = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # orjson rejects some documents the json module accepts,
+                # such as NaN or integers wider than 64 bits
+                data = json.loads(text)
+        self._local.data = (text, data)
+        return data
     
-    def extract_content(self, path: Path) -> str:
+    def _dumps(self, data) -> str:
+        """Pretty print parsed JSON with two-space indentation"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode('utf-8')
+            except TypeError:
+                pass
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Pretty print for better readability
-                return json.dumps(data, indent=2, ensure_ascii=False)
+            if text is None:
+                text = self.read_text(path)
+            data = self._parse(text)
+            # Pretty print for better readability
+            return self._dumps(data)
         except Exception as e:
             logger.error(f"Error reading JSON file {path}: {e}")
-            # Try to read as text if JSON parsing fails
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Return the text as is if JSON parsing fails
+            if text is None:
+                text = self.read_text(path)
+            return text
     
-    def extract_metadata(self, path: Path) -> Dict:
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
+            if text is None:
+                text = self.read_text(path)
+            data = self._parse(text)
+            
             metadata = {
                 'format': 'json',
                 'valid': True,
@@ -176,26 +254,41 @@ class YAMLHandler(FormatHandler):
     format_type = DocumentFormat.YAML
     extensions = ['.yaml', '.yml']
     
-    def can_handle(self, path: Path) -> bool:
-        return path.suffix.lower() in self.extensions
+    def __init__(self):
+        # Last parsed document per scanner thread, see _parse()
+        self._local = threading.local()
+    
+    def _parse(self, text: str):
+        """Parse YAML, reusing the result when given the same text again"""
+        cached = getattr(self._local, 'data', None)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        
+        data = yaml.load(text, Loader=_YAMLLoader)
+        self._local.data = (text, data)
+        return data
     
-    def extract_content(self, path: Path) -> str:
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                # Convert back to YAML for consistent formatting
-                return yaml.dump(data, default_flow_style=False, sort_keys=False)
+            if text is None:
+                text = self.read_text(path)
+            data = self._parse(text)
+            # Convert back to YAML for consistent formatting
+            return yaml.dump(data, Dumper=_YAMLDumper,
+                             default_flow_style=False, sort_keys=False)
         except Exception as e:
             logger.error(f"Error reading YAML file {path}: {e}")
-            # Read as text if YAML parsing fails
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Return the text as is if YAML parsing fails
+            if text is None:
+                text = self.read_text(path)
+            return text
     
-    def extract_metadata(self, path: Path) -> Dict:
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                
+            if text is None:
+                text = self.read_text(path)
+            data = self._parse(text)
+            
             metadata = {
                 'format': 'yaml',
                 'valid': True,
@@ -218,35 +311,43 @@ class PythonHandler(FormatHandler):
     format_type = DocumentFormat.CODE
     extensions = ['.py', '.pyw', '.pyi']
     
-    def can_handle(self, path: Path) -> bool:
-        return path.suffix.lower() in self.extensions
-    
-    def extract_content(self, path: Path) -> str:
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
+        if text is not None:
+            return text
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return self.read_text(path)
         except Exception as e:
             logger.error(f"Error reading Python file {path}: {e}")
             raise
     
-    def extract_metadata(self, path: Path) -> Dict:
-        content = self.extract_content(path)
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
+        content = self.extract_content(path, text)
         
         metadata = {
             'language': 'python',
             'line_count': len(content.splitlines()),
         }
         
-        # Extract imports
-        imports = []
-        for line in content.splitlines():
-            if line.strip().startswith('import ') or line.strip().startswith('from '):
-                imports.append(line.strip())
-        metadata['imports'] = imports[:20]  # First 20 imports
-        
-        # Extract classes and functions
         try:
             tree = ast.parse(content)
+        except:
+            tree = None
+        
+        if tree is None:
+            # Fall back to a line scan for files that do not parse
+            imports = []
+            for line in content.splitlines():
+                if line.strip().startswith('import ') or line.strip().startswith('from '):
+                    imports.append(line.strip())
+            metadata['imports'] = imports[:20]  # First 20 imports
+            
+            docstring_match = _DOCSTRING_DQ_RE.match(content)
+            if not docstring_match:
+                docstring_match = _DOCSTRING_SQ_RE.match(content)
+            docstring = docstring_match.group(1) if docstring_match else None
+        else:
+            # Extract imports, classes and functions in one walk
+            import_lines = set()
             classes = []
             functions = []
             
@@ -255,26 +356,30 @@ class PythonHandler(FormatHandler):
                     classes.append(node.name)
                 elif isinstance(node, ast.FunctionDef):
                     functions.append(node.name)
+                elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                    import_lines.add(node.lineno)
             
+            # Imports in source order, as written on their first line;
+            # read_text() normalizes newlines, so lines match AST line numbers
+            lines = content.split('\n')
+            metadata['imports'] = [
+                lines[lineno - 1].strip() for lineno in sorted(import_lines)[:20]
+            ]
             metadata['classes'] = classes[:20]
             metadata['functions'] = functions[:20]
-        except:
-            pass
+            
+            docstring = ast.get_docstring(tree)
         
-        # Extract docstring
-        docstring_match = re.match(r'^\s*"""(.*?)"""', content, re.DOTALL)
-        if not docstring_match:
-            docstring_match = re.match(r"^\s*'''(.*?)'''", content, re.DOTALL)
-        if docstring_match:
-            metadata['docstring'] = docstring_match.group(1).strip()[:500]
+        if docstring:
+            metadata['docstring'] = docstring.strip()[:500]
         
         return metadata
     
-    def extract_title(self, path: Path, content: str) -> str:
+    def extract_title(self, path: Path, content: str, text: Optional[str] = None) -> str:
         # Try to extract from module docstring
-        docstring_match = re.match(r'^\s*"""(.*?)"""', content, re.DOTALL)
+        docstring_match = _DOCSTRING_DQ_RE.match(content)
         if not docstring_match:
-            docstring_match = re.match(r"^\s*'''(.*?)'''", content, re.DOTALL)
+            docstring_match = _DOCSTRING_SQ_RE.match(content)
         
         if docstring_match:
             first_line = docstring_match.group(1).strip().split('\n')[0]
@@ -289,50 +394,61 @@ class HTMLHandler(FormatHandler):
     
     format_type = DocumentFormat.HTML
     extensions = ['.html', '.htm', '.xhtml']
+    encoding_errors = 'ignore'
+    
+    def __init__(self):
+        # Last parsed document per scanner thread, see _parse()
+        self._local = threading.local()
     
-    def can_handle(self, path: Path) -> bool:
-        return path.suffix.lower() in self.extensions
+    def _parse(self, html_content: str):
+        """Parse HTML, reusing the tree when given the same text again
+        
+        process() passes one text object to all three extractors, so each
+        file is parsed once instead of three times.
+        """
+        cached = getattr(self._local, 'soup', None)
+        if cached is not None and cached[0] is html_content:
+            return cached[1]
+        
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
+        self._local.soup = (html_content, soup)
+        return soup
     
-    def extract_content(self, path: Path) -> str:
+    def extract_content(self, path: Path, text: Optional[str] = None) -> str:
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                html_content = f.read()
+            html_content = text if text is not None else self.read_text(path)
             
-            # Try to extract text from HTML
-            try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                
-                # Get text
-                text = soup.get_text()
-                
-                # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = '\n'.join(chunk for chunk in chunks if chunk)
-                
-                return text
-            except ImportError:
-                # If BeautifulSoup not available, return raw HTML
+            # If BeautifulSoup not available, return raw HTML
+            if BeautifulSoup is None:
                 return html_content
+            
+            # Try to extract text from HTML
+            soup = self._parse(html_content)
+            
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
+            
+            # Get text
+            text = soup.get_text()
+            
+            # Clean up whitespace
+            lines = (line.strip() for line in text.splitlines())
+            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+            text = '\n'.join(chunk for chunk in chunks if chunk)
+            
+            return text
                 
         except Exception as e:
             logger.error(f"Error reading HTML file {path}: {e}")
             raise
     
-    def extract_metadata(self, path: Path) -> Dict:
+    def extract_metadata(self, path: Path, text: Optional[str] = None) -> Dict:
         metadata = {'format': 'html'}
         
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                html_content = f.read()
-            
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            html_content = text if text is not None else self.read_text(path)
+            soup = self._parse(html_content)
             
             # Extract title
             title_tag = soup.find('title')
@@ -360,13 +476,10 @@ class HTMLHandler(FormatHandler):
         
         return metadata
     
-    def extract_title(self, path: Path, content: str) -> str:
+    def extract_title(self, path: Path, content: str, text: Optional[str] = None) -> str:
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                html_content = f.read()
-            
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            html_content = text if text is not None else self.read_text(path)
+            soup = self._parse(html_content)
             
             # Try <title> tag
             title_tag = soup.find('title')
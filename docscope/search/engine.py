@@ -215,6 +215,14 @@ class SearchEngine:
         """
         return self.indexer.index_documents(documents, batch_size)
     
+    def batch_writer(self):
+        """Group index changes into a single commit
+        
+        Returns:
+            Context manager yielding an IndexBatch
+        """
+        return self.indexer.batch_writer()
+    
     def delete_document(self, doc_id: str) -> bool:
         """Delete a document from index
         
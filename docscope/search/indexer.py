@@ -2,8 +2,9 @@
 
 import os
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator
 from datetime import datetime
 import shutil
 
@@ -19,6 +20,43 @@ from ..core.exceptions import SearchError
 logger = get_logger(__name__)
 
 
+class IndexBatch:
+    """Index changes staged on a single writer by DocumentIndexer.batch_writer"""
+    
+    def __init__(self, indexer: 'DocumentIndexer', writer):
+        self._indexer = indexer
+        self._writer = writer
+        self.indexed: List[Document] = []
+        self.deleted = 0
+    
+    def add_many(self, documents: Iterable[Document]) -> None:
+        """Add or replace documents
+        
+        Args:
+            documents: Documents to index
+        """
+        for doc in documents:
+            self._writer.update_document(**self._indexer._prepare_document_data(doc))
+            self.indexed.append(doc)
+    
+    def update_many(self, updates: Dict[str, Document]) -> None:
+        """Replace documents by ID
+        
+        Args:
+            updates: Mapping of document ID to its new version
+        """
+        self.add_many(updates.values())
+    
+    def delete_many(self, doc_ids: Iterable[str]) -> None:
+        """Delete documents by ID
+        
+        Args:
+            doc_ids: Document IDs to delete
+        """
+        for doc_id in doc_ids:
+            self.deleted += self._writer.delete_by_term('id', doc_id)
+
+
 class DocumentIndexer:
     """Indexes documents for full-text search"""
     
@@ -145,6 +183,36 @@ class DocumentIndexer:
         
         return indexed
     
+    @contextmanager
+    def batch_writer(self) -> Iterator[IndexBatch]:
+        """Stage additions, updates and deletions on one writer
+        
+        Everything staged inside the block is committed once on exit, or
+        discarded if the block raises.
+        
+        Yields:
+            Batch accepting add_many, update_many and delete_many calls
+        """
+        writer = self.doc_index.writer()
+        batch = IndexBatch(self, writer)
+        
+        try:
+            yield batch
+        except Exception:
+            writer.cancel()
+            raise
+        
+        try:
+            writer.commit()
+        except Exception as e:
+            logger.error(f"Failed to commit index batch: {e}")
+            raise SearchError(f"Batch indexing failed: {e}")
+        
+        logger.debug(f"Committed index batch: {len(batch.indexed)} indexed, {batch.deleted} deleted")
+        
+        if batch.indexed:
+            self._update_suggestions_batch(batch.indexed)
+    
     def delete_document(self, doc_id: str) -> bool:
         """Delete a document from the index
         
@@ -57,36 +57,71 @@ class DocumentStore:
         try:
             with self.db_manager.session_scope() as session:
                 repo = DocumentRepository(session)
-                
-                # Check if document already exists
-                existing = repo.get_by_path(doc.path)
-                if existing:
-                    # Update existing document
-                    updates = {
-                        'title': doc.title,
-                        'content': doc.content,
-                        'content_hash': doc.content_hash,
-                        'format': doc.format.value,
-                        'size': doc.size,
-                        'modified_at': doc.modified_at,
-                        'indexed_at': doc.indexed_at,
-                        'doc_metadata': doc.metadata,
-                        'status': doc.status.value,
-                        'error': doc.error
-                    }
-                    repo.update(existing.id, updates)
-                    logger.debug(f"Updated document: {doc.path}")
-                    return existing.id
-                else:
-                    # Create new document
-                    db_doc = repo.create(doc)
-                    logger.debug(f"Stored new document: {doc.path}")
-                    return db_doc.id
+                return self._store_in_session(repo, doc)
                     
         except Exception as e:
             logger.error(f"Failed to store document {doc.path}: {e}")
             raise StorageError(f"Failed to store document: {e}")
     
+    def store_documents(self, docs: List[Document]) -> List[str]:
+        """Store several documents in a single transaction
+        
+        Args:
+            docs: Documents to store
+            
+        Returns:
+            Document IDs, in the same order as docs
+        """
+        if not self._initialized:
+            self.initialize()
+        
+        if not docs:
+            return []
+        
+        try:
+            with self.db_manager.session_scope() as session:
+                repo = DocumentRepository(session)
+                return [self._store_in_session(repo, doc) for doc in docs]
+                
+        except Exception as e:
+            logger.error(f"Failed to store {len(docs)} documents: {e}")
+            raise StorageError(f"Failed to store documents: {e}")
+    
+    def _store_in_session(self, repo: DocumentRepository, doc: Document) -> str:
+        """Create or update a document using an open repository session
+        
+        Args:
+            repo: Repository bound to the current session
+            doc: Document to store
+            
+        Returns:
+            Document ID
+        """
+        # Check if document already exists
+        existing = repo.get_by_path(doc.path)
+        if existing:
+            # Update existing document
+            updates = {
+                'title': doc.title,
+                'content': doc.content,
+                'content_hash': doc.content_hash,
+                'format': doc.format.value,
+                'size': doc.size,
+                'modified_at': doc.modified_at,
+                'indexed_at': doc.indexed_at,
+                'doc_metadata': doc.metadata,
+                'status': doc.status.value,
+                'error': doc.error
+            }
+            repo.update(existing.id, updates)
+            logger.debug(f"Updated document: {doc.path}")
+            return existing.id
+        else:
+            # Create new document
+            db_doc = repo.create(doc)
+            logger.debug(f"Stored new document: {doc.path}")
+            return db_doc.id
+    
     def get_document(self, doc_id: str) -> Optional[Document]:
         """Retrieve a document by ID
         
@@ -181,6 +216,57 @@ class DocumentStore:
             logger.error(f"Failed to delete document {doc_id}: {e}")
             raise StorageError(f"Failed to delete document: {e}")
     
+    def update_documents(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """Update several documents in a single transaction
+        
+        Args:
+            updates: Mapping of document ID to its updates
+            
+        Returns:
+            Number of documents updated
+        """
+        if not self._initialized:
+            self.initialize()
+        
+        if not updates:
+            return 0
+        
+        try:
+            with self.db_manager.session_scope() as session:
+                repo = DocumentRepository(session)
+                return sum(
+                    1 for doc_id, doc_updates in updates.items()
+                    if repo.update(doc_id, doc_updates) is not None
+                )
+                
+        except Exception as e:
+            logger.error(f"Failed to update {len(updates)} documents: {e}")
+            raise StorageError(f"Failed to update documents: {e}")
+    
+    def delete_documents(self, doc_ids: List[str]) -> int:
+        """Delete several documents in a single transaction
+        
+        Args:
+            doc_ids: Document IDs
+            
+        Returns:
+            Number of documents deleted
+        """
+        if not self._initialized:
+            self.initialize()
+        
+        if not doc_ids:
+            return 0
+        
+        try:
+            with self.db_manager.session_scope() as session:
+                repo = DocumentRepository(session)
+                return sum(1 for doc_id in doc_ids if repo.delete(doc_id))
+                
+        except Exception as e:
+            logger.error(f"Failed to delete {len(doc_ids)} documents: {e}")
+            raise StorageError(f"Failed to delete documents: {e}")
+    
     def store_scan_result(self, result: ScanResult) -> int:
         """Store documents from a scan result
         
@@ -98,6 +98,17 @@ class TestExporter:
         assert data[0]['title'] == 'Doc 1'
         assert data[1]['title'] == 'Doc 2'
     
+    def test_export_content_limit(self, exporter, sample_document):
+        """Test truncating content before serialization"""
+        result = exporter.export_document(
+            sample_document, ExportFormat.JSON, content_limit=4
+        )
+        data = json.loads(result)
+
+        assert data[0]['content'] == 'This'
+        # Source document is left untouched
+        assert sample_document['content'] == 'This is test content'
+
     def test_export_search_results(self, exporter):
         """Test exporting search results"""
         # Create mock search results
@@ -199,7 +210,20 @@ class TestFileWatcher:
         # Test allowed files
         assert watcher.should_process(Path('test.py')) == True
         assert watcher.should_process(Path('doc.md')) == True
-    
+        # Patterns match whole path components, not substrings
+        assert watcher.should_process(Path('.github/workflow.yml')) == True
+
+    def test_should_process_supported_formats(self, watcher):
+        """Test extension filter built from the scanner's formats"""
+        scanner = Mock()
+        scanner.get_supported_formats.return_value = ['.md', '.TXT']
+        watcher.scanner = scanner
+
+        assert watcher.should_process('/docs/readme.md') == True
+        assert watcher.should_process('/docs/NOTES.txt') == True
+        assert watcher.should_process('/build/main.o') == False
+        scanner.detect_format.assert_not_called()
+
     def test_event_handling(self, watcher):
         """Test event handling"""
         events_received = []
@@ -237,6 +261,7 @@ class TestFileWatcher:
         watcher.handle_event(event1)
         watcher.handle_event(event2)
         watcher.handle_event(event3)
+        watcher._drain_raw_events()
         
         # Should only keep the last event
         assert len(watcher.pending_events) == 1
@@ -345,7 +370,7 @@ class TestFileWatcher:
         # Verify calls
         mock_search.delete_document.assert_called_once_with('123')
         mock_storage.delete_document.assert_called_once_with('123')
-
+    
 
 class TestPerformanceMonitor:
     """Test performance monitoring"""
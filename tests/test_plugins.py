@@ -222,6 +222,16 @@ class TestPluginRegistry:
         assert "test_plugin" in plugins
         assert "test_plugin2" in plugins
     
+    def test_iter_enabled_names(self):
+        """Test listing enabled plugin names"""
+        registry = PluginRegistry()
+        registry.register(TestPlugin())
+        
+        assert list(registry.iter_enabled_names()) == ["test_plugin"]
+        
+        registry.disable_plugin("test_plugin")
+        assert list(registry.iter_enabled_names()) == []
+    
     def test_execute_hook(self):
         """Test executing hooks"""
         registry = PluginRegistry()
@@ -255,6 +265,19 @@ class TestPluginRegistry:
         result = registry.execute_command("test_plugin:add", 3, 4)
         assert result == 7
     
+    def test_execute_command_without_prefix(self):
+        """Test executing plugin commands by bare name"""
+        registry = PluginRegistry()
+        plugin = TestPlugin()
+        plugin.register_command("add", lambda x, y: x + y, "Add two numbers")
+        registry.register(plugin)
+        
+        assert registry.execute_command("add", 3, 4) == 7
+        
+        registry.unregister("test_plugin")
+        with pytest.raises(PluginNotFoundError):
+            registry.execute_command("add", 3, 4)
+    
     def test_get_plugins_by_capability(self):
         """Test getting plugins by capability"""
         registry = PluginRegistry()
@@ -287,6 +310,36 @@ class TestPluginLoader:
         # Should find built-in plugins at least
         assert isinstance(plugins, list)
     
+    def test_discover_plugins_cache(self, config, tmp_path):
+        """Test discovered plugins are cached until a directory changes"""
+        loader = PluginLoader(config)
+        loader.plugin_dirs = [tmp_path]
+        (tmp_path / "first.py").write_text("")
+        
+        assert loader.discover_plugins() == ["first"]
+        
+        (tmp_path / "second.py").write_text("")
+        assert sorted(loader.discover_plugins()) == ["first", "second"]
+        
+        # A package completed after its directory was listed needs invalidate()
+        package = tmp_path / "package"
+        package.mkdir()
+        loader.discover_plugins()
+        (package / "__init__.py").write_text("")
+        loader.invalidate()
+        assert "package" in loader.discover_plugins()
+    
+    def test_command_dependency_installed_later(self, config, tmp_path, monkeypatch):
+        """Test a missing command is found once it is installed"""
+        loader = PluginLoader(config)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert not loader._check_dependency("cmd:docscope-test-tool")
+        
+        tool = tmp_path / "docscope-test-tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        assert loader._check_dependency("cmd:docscope-test-tool")
+    
     def test_load_plugin_config(self, config):
         """Test loading plugin configuration"""
         loader = PluginLoader(config)
@@ -272,6 +272,23 @@ def test_delete_document(search_engine, sample_documents):
     )
 
 
+def test_batch_writer(search_engine, sample_documents):
+    """Test staging index changes in a single commit"""
+    first, *rest = sample_documents
+
+    with search_engine.batch_writer() as batch:
+        batch.add_many(rest)
+        batch.update_many({first.id: first})
+
+    assert search_engine.get_stats()['total_documents'] == len(sample_documents)
+
+    with search_engine.batch_writer() as batch:
+        batch.delete_many([first.id])
+
+    assert batch.deleted == 1
+    assert search_engine.get_stats()['total_documents'] == len(sample_documents) - 1
+
+
 def test_clear_index(search_engine, sample_documents):
     """Test clearing the index"""
     search_engine.index_documents(sample_documents)
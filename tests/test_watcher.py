@@ -0,0 +1,194 @@
+"""Tests for the file watcher and the inotify observer"""
+
+import pytest
+import os
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+from docscope.features.watcher import FileWatcher, WatchEvent, WatchEventType
+from docscope.features.inotify import INOTIFY_AVAILABLE, InotifyObserver
+from docscope.core.config import StorageConfig
+from docscope.core.models import Document, DocumentFormat
+from docscope.storage import DocumentStore
+
+
+@pytest.fixture
+def watcher():
+    """Create watcher instance"""
+    return FileWatcher()
+
+
+@pytest.fixture
+def document_store(tmp_path):
+    """Create document store backed by a temporary database"""
+    store = DocumentStore(StorageConfig(
+        backend="sqlite",
+        sqlite={"path": str(tmp_path / 'watch.db')},
+        cache={"enabled": False}
+    ))
+    store.initialize(drop_existing=True)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def scanner():
+    """Create scanner that reads markdown files as they are on disk"""
+    scanner = Mock()
+    scanner.scan_file.side_effect = lambda path: {
+        'title': path.stem,
+        'content': path.read_text(),
+        'format': 'markdown'
+    }
+    return scanner
+
+
+def store_file(store, path, text):
+    """Write a file and store a document for it"""
+    path.write_text(text)
+    doc_id = str(uuid.uuid4())
+    store.store_document(Document(
+        id=doc_id,
+        path=str(path),
+        title=path.stem,
+        content=text,
+        format=DocumentFormat.MARKDOWN,
+        size=len(text),
+        content_hash=text,
+        created_at=datetime.now(),
+        modified_at=datetime.now()
+    ))
+    return doc_id
+
+
+class TestEventCoalescing:
+    """Test merging events within a batch"""
+
+    def test_event_coalescing(self, watcher):
+        """Test merging event types within a batch"""
+        created = WatchEvent(type=WatchEventType.CREATED, path='/test/tmp.txt')
+        deleted = WatchEvent(type=WatchEventType.DELETED, path='/test/tmp.txt')
+        modified = WatchEvent(type=WatchEventType.MODIFIED, path='/test/doc.txt')
+        removed = WatchEvent(type=WatchEventType.DELETED, path='/test/doc.txt')
+        recreated = WatchEvent(type=WatchEventType.CREATED, path='/test/doc.txt')
+
+        for event in (created, deleted, modified, removed, recreated):
+            watcher.handle_event(event)
+        watcher._drain_raw_events()
+
+        # Created then deleted cancels out; a replaced file is a modification
+        assert list(watcher.pending_events) == ['/test/doc.txt']
+        assert watcher.pending_events['/test/doc.txt'].type == WatchEventType.MODIFIED
+
+    def test_move_over_moved_file(self, watcher):
+        """Test a second move onto a path deletes the first move's source"""
+        watcher.handle_event(WatchEvent(WatchEventType.MOVED, '/test/b.md', '/test/c.md'))
+        watcher.handle_event(WatchEvent(WatchEventType.MOVED, '/test/b.md', '/test/a.md'))
+        watcher._drain_raw_events()
+
+        pending = watcher.pending_events
+        assert set(pending) == {'/test/b.md', '/test/c.md'}
+        assert pending['/test/b.md'].old_path == '/test/a.md'
+        assert pending['/test/c.md'].type == WatchEventType.DELETED
+
+    def test_new_file_moved_over_deleted_file(self, watcher):
+        """Test a new file renamed over a deleted one updates its document"""
+        watcher.handle_event(WatchEvent(WatchEventType.DELETED, '/test/b.md'))
+        watcher.handle_event(WatchEvent(WatchEventType.CREATED, '/test/b.tmp'))
+        watcher.handle_event(WatchEvent(WatchEventType.MOVED, '/test/b.md', '/test/b.tmp'))
+        watcher._drain_raw_events()
+
+        assert list(watcher.pending_events) == ['/test/b.md']
+        assert watcher.pending_events['/test/b.md'].type == WatchEventType.MODIFIED
+
+
+class TestBatchStorage:
+    """Test writing batches through the real document store"""
+
+    def test_process_batch_with_document_store(self, watcher, document_store, scanner, tmp_path):
+        """Test writing a mixed batch through the real document store"""
+        kept = tmp_path / 'kept.md'
+        gone = tmp_path / 'gone.md'
+        new = tmp_path / 'new.md'
+        store_file(document_store, kept, '# Old')
+        store_file(document_store, gone, '# Gone')
+        kept.write_text('# Updated')
+        gone.unlink()
+        new.write_text('# New')
+
+        watcher.scanner = scanner
+        watcher.storage = document_store
+
+        watcher._process_batch([
+            WatchEvent(type=WatchEventType.CREATED, path=str(new)),
+            WatchEvent(type=WatchEventType.MODIFIED, path=str(kept)),
+            WatchEvent(type=WatchEventType.DELETED, path=str(gone)),
+        ])
+
+        created = document_store.get_document_by_path(str(new))
+        assert created.content == '# New'
+        assert created.format == DocumentFormat.MARKDOWN
+        assert document_store.get_document_by_path(str(kept)).content == '# Updated'
+        assert document_store.get_document_by_path(str(gone)) is None
+
+    def test_move_over_deleted_file(self, watcher, document_store, scanner, tmp_path):
+        """Test rm b; mv a b leaves a single document at b"""
+        a = tmp_path / 'a.md'
+        b = tmp_path / 'b.md'
+        moved_id = store_file(document_store, a, '# A')
+        replaced_id = store_file(document_store, b, '# B')
+        b.unlink()
+        a.rename(b)
+
+        watcher.scanner = scanner
+        watcher.storage = document_store
+        watcher.handle_event(WatchEvent(WatchEventType.DELETED, str(b)))
+        watcher.handle_event(WatchEvent(WatchEventType.MOVED, str(b), str(a)))
+        watcher._drain_raw_events()
+        watcher._process_batch(list(watcher.pending_events.values()))
+
+        document = document_store.get_document_by_path(str(b))
+        assert document.id == moved_id
+        assert document.content == '# A'
+        assert document_store.get_document(replaced_id) is None
+        assert document_store.get_document_by_path(str(a)) is None
+
+
+@pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify is only available on Linux")
+class TestInotifyObserver:
+    """Test the inotify observer"""
+
+    def test_write_after_rename_over_watched_file(self, tmp_path):
+        """Test per-file watches follow a file replaced by rename"""
+        modified = []
+        handler = Mock()
+        handler.on_modified.side_effect = lambda event: modified.append(event.src_path)
+
+        target = tmp_path / 'doc.md'
+        target.write_text('old')
+        observer = InotifyObserver(file_filter=lambda path: path.endswith('.md'))
+        observer.schedule(handler, str(tmp_path), recursive=True)
+        observer.start()
+
+        try:
+            # Atomic save: write a temporary file and rename it over the target
+            temp = tmp_path / 'doc.tmp'
+            temp.write_text('new')
+            os.replace(temp, target)
+            time.sleep(0.2)
+
+            with open(target, 'a') as f:
+                f.write(' edited')
+
+            deadline = time.monotonic() + 5
+            while str(target) not in modified and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            observer.stop()
+            observer.join(timeout=5)
+            observer.close()
+
+        assert str(target) in modified